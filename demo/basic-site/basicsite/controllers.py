@@ -1,39 +1,55 @@
 """Basic site controller that adds published pages to the navigation."""
 
 from pathlib import Path
-from uuid import UUID
 
 from litestar import Controller, Request, get
 from litestar.exceptions import NotFoundException
 from litestar.response import Template as TemplateResponse
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from skrift.content import get_content_area, hydrate
+from skrift.controllers.helpers import parse_uuid
+from skrift.db.models import Asset, Page
 from skrift.db.models.user import User
 from skrift.db.services import content_service, page_service
+from skrift.db.services.asset_service import get_asset_urls
 from skrift.db.services.setting_service import get_cached_site_name, get_cached_site_base_url
+from skrift.flash import pop_flash
 from skrift.seo import get_page_seo_meta, get_page_og_meta
 from skrift.storage import StorageManager
 from skrift.template import Template
 
 TEMPLATE_DIR = Path(__file__).parent.parent.parent.parent / "skrift" / "templates"
 
+# Asset columns the page view and page.html read; the rest stay unloaded.
+_PAGE_ASSET_COLUMNS = (
+    Asset.id, Asset.store, Asset.key, Asset.content_type, Asset.filename, Asset.alt_text,
+)
+_PAGE_VIEW_OPTIONS = (
+    selectinload(Page.assets).load_only(*_PAGE_ASSET_COLUMNS),
+    joinedload(Page.featured_asset).load_only(*_PAGE_ASSET_COLUMNS),
+)
+
 
 class SiteController(Controller):
     path = "/"
 
-    async def _get_user(self, request: Request, db_session: AsyncSession) -> User | None:
+    async def _get_user(self, request: Request, db_session: AsyncSession) -> Row | None:
+        """Load just the columns the navbar renders.
+
+        A lightweight row skips ORM identity-map bookkeeping and the eager
+        role/enrollment loads that a full ``User`` entity would pull in.
+        """
         user_id = request.session.get("user_id")
         if not user_id:
             return None
         result = await db_session.execute(
-            select(User)
-            .where(User.id == UUID(user_id))
-            .options(selectinload(User.second_factor_enrollments))
+            select(User.id, User.email, User.name, User.picture_url)
+            .where(User.id == parse_uuid(user_id))
         )
-        return result.scalar_one_or_none()
+        return result.one_or_none()
 
     async def _get_nav_pages(self, db_session: AsyncSession) -> list:
         return await page_service.list_pages(
@@ -43,7 +59,7 @@ class SiteController(Controller):
     @get("/")
     async def index(self, request: Request, db_session: AsyncSession) -> TemplateResponse:
         user = await self._get_user(request, db_session)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         nav_pages = await self._get_nav_pages(db_session)
 
         # Hydrate the admin-editable "home" content area declared in code.
@@ -68,27 +84,32 @@ class SiteController(Controller):
     async def view_page(
         self, request: Request, db_session: AsyncSession, path: str
     ) -> TemplateResponse:
+        slugs = tuple(filter(None, path.split("/")))
+        if not slugs:
+            # Only separators (e.g. "//"): no page can match, skip the lookup.
+            raise NotFoundException(f"Page '{path}' not found")
+
         user = await self._get_user(request, db_session)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         nav_pages = await self._get_nav_pages(db_session)
 
-        slugs = [s for s in path.split("/") if s]
         page_slug = "/".join(slugs)
 
         page = await page_service.get_page_by_slug(
-            db_session, page_slug, published_only=not request.session.get("user_id")
+            db_session,
+            page_slug,
+            published_only=not request.session.get("user_id"),
+            options=_PAGE_VIEW_OPTIONS,
         )
         if not page:
             raise NotFoundException(f"Page '{path}' not found")
 
-        # Resolve asset URLs
+        # Resolve asset URLs concurrently. The DB lookups above stay sequential
+        # because a single AsyncSession can't run queries in parallel.
         storage: StorageManager = request.app.state.storage_manager
         featured_image_url = None
-        asset_urls = {}
-        for asset in page.assets:
-            backend = await storage.get(asset.store)
-            url = await backend.get_url(asset.key)
-            asset_urls[str(asset.id)] = url
+        urls = await get_asset_urls(storage, page.assets)
+        asset_urls = {str(asset.id): url for asset, url in zip(page.assets, urls)}
         if page.featured_asset and str(page.featured_asset.id) in asset_urls:
             featured_image_url = asset_urls[str(page.featured_asset.id)]
 
@@ -1,21 +1,20 @@
 """Blog demo controller — homepage, single post, and static pages."""
 
 from pathlib import Path
-from uuid import UUID
 
 from litestar import Controller, Request, get
 from litestar.exceptions import NotFoundException
 from litestar.response import Template as TemplateResponse
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from skrift.db.models.user import User
+from skrift.controllers.helpers import get_user_context
 from skrift.db.services import page_service
 from skrift.db.services.setting_service import (
     get_cached_site_name,
     get_cached_site_base_url,
     get_cached_site_theme,
 )
+from skrift.flash import pop_flash
 from skrift.hooks import RESOLVE_THEME, apply_filters
 from skrift.notifications import ensure_nid
 from skrift.seo import get_page_seo_meta, get_page_og_meta
@@ -29,18 +28,6 @@ TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
 class BlogController(Controller):
     path = "/"
 
-    async def _get_user_context(
-        self, request: "Request", db_session: AsyncSession
-    ) -> dict:
-        user_id = request.session.get("user_id")
-        if not user_id:
-            return {"user": None}
-        result = await db_session.execute(
-            select(User).where(User.id == UUID(user_id))
-        )
-        user = result.scalar_one_or_none()
-        return {"user": user}
-
     async def _resolve_theme(self, request: "Request") -> str:
         theme_name = get_cached_site_theme()
         return await apply_filters(RESOLVE_THEME, theme_name, request)
@@ -50,9 +37,9 @@ class BlogController(Controller):
         self, request: "Request", db_session: AsyncSession
     ) -> TemplateResponse:
         """Blog homepage — list published posts."""
-        user_ctx = await self._get_user_context(request, db_session)
+        user_ctx = await get_user_context(request, db_session)
         theme_name = await self._resolve_theme(request)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
 
         # Ensure notification ID for real-time updates
         nid = ensure_nid(request)
@@ -91,9 +78,9 @@ class BlogController(Controller):
         self, request: "Request", db_session: AsyncSession, slug: str
     ) -> TemplateResponse:
         """Single post view."""
-        user_ctx = await self._get_user_context(request, db_session)
+        user_ctx = await get_user_context(request, db_session)
         theme_name = await self._resolve_theme(request)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
 
         nid = ensure_nid(request)
         blog.hooks.register_blog_session(nid)
@@ -134,11 +121,15 @@ class BlogController(Controller):
         self, request: "Request", db_session: AsyncSession, path: str
     ) -> TemplateResponse:
         """Static page fallback with WP-like template resolution."""
-        user_ctx = await self._get_user_context(request, db_session)
+        slugs = tuple(filter(None, path.split("/")))
+        if not slugs:
+            # Only separators (e.g. "//"): no page can match, skip the lookup.
+            raise NotFoundException(f"Page '{path}' not found")
+
+        user_ctx = await get_user_context(request, db_session)
         theme_name = await self._resolve_theme(request)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
 
-        slugs = [s for s in path.split("/") if s]
         page_slug = "/".join(slugs)
 
         page = await page_service.get_page_by_slug(
@@ -1,14 +1,40 @@
 """Blog hooks — real-time notification when posts are published."""
 
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
 from skrift.hooks import action, AFTER_PAGE_SAVE
 from skrift.notifications import notify_session, NotificationMode
 
-_blog_session_nids: set[str] = set()
+logger = logging.getLogger(__name__)
+
+# Session NIDs seen on blog pages, mapped to when they were last seen. The TTL
+# matches the default session lifetime so NIDs of sessions that can no longer
+# exist are dropped; the cap bounds memory. Least-recently-seen entries first.
+_blog_session_nids: OrderedDict[str, float] = OrderedDict()
+BLOG_SESSION_TTL = 86400.0
+MAX_BLOG_SESSIONS = 10_000
+
+
+def _purge_expired_blog_sessions(now: float) -> None:
+    """Drop lapsed NIDs from the front, stopping at the first live one."""
+    while _blog_session_nids:
+        oldest_nid = next(iter(_blog_session_nids))
+        if now - _blog_session_nids[oldest_nid] < BLOG_SESSION_TTL:
+            return
+        del _blog_session_nids[oldest_nid]
 
 
 def register_blog_session(nid: str) -> None:
     """Track a session NID for blog real-time updates."""
-    _blog_session_nids.add(nid)
+    now = time.monotonic()
+    _blog_session_nids[nid] = now
+    _blog_session_nids.move_to_end(nid)
+    _purge_expired_blog_sessions(now)
+    while len(_blog_session_nids) > MAX_BLOG_SESSIONS:
+        _blog_session_nids.popitem(last=False)
 
 
 @action(AFTER_PAGE_SAVE, priority=20)
@@ -17,14 +43,29 @@ async def notify_new_post(page, *, is_new=False, **kwargs):
     if page.type != "post" or not page.is_published:
         return
 
-    for nid in _blog_session_nids:
-        await notify_session(
-            nid,
-            "new_post",
-            mode=NotificationMode.TIMESERIES,
-            slug=page.slug,
-            title=page.title,
-            published_at=page.published_at.isoformat() if page.published_at else "",
-            meta_description=page.meta_description or "",
-            group=f"post:{page.slug}",
-        )
+    payload = {
+        "slug": page.slug,
+        "title": page.title,
+        "published_at": page.published_at.isoformat() if page.published_at else "",
+        "meta_description": page.meta_description or "",
+    }
+    # Fan out concurrently; snapshot the NIDs since new sessions may register
+    # while the sends are in flight.
+    _purge_expired_blog_sessions(time.monotonic())
+    nids = list(_blog_session_nids)
+    results = await asyncio.gather(
+        *(
+            notify_session(
+                nid,
+                "new_post",
+                mode=NotificationMode.TIMESERIES,
+                group=f"post:{page.slug}",
+                **payload,
+            )
+            for nid in nids
+        ),
+        return_exceptions=True,
+    )
+    for nid, result in zip(nids, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to notify blog session %s", nid, exc_info=result)
@@ -20,6 +20,11 @@ depends_on: Union[str, Sequence[str], None] = ("skrift",)
 
 
 def upgrade() -> None:
+    # Indexes here are built in the migration transaction on purpose: every
+    # table is created empty in this same revision, so there are no rows to
+    # scan and no concurrent writers to block. CREATE INDEX CONCURRENTLY
+    # (which must run outside a transaction) is for indexes added to
+    # populated tables in later revisions, e.g. 7c3e9a1d5b2f.
     op.create_table('tweets',
     sa.Column('id', advanced_alchemy.types.guid.GUID(length=16), nullable=False),
     sa.Column('user_id', advanced_alchemy.types.guid.GUID(length=16), nullable=False),
@@ -0,0 +1,43 @@
+"""add partial index for a user's live top-level tweets
+
+Revision ID: 7c3e9a1d5b2f
+Revises: 41fcc492d07a
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9a1d5b2f'
+down_revision: Union[str, None] = '41fcc492d07a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ACTIVE_ROOT = sa.text("is_deleted = false AND parent_id IS NULL")
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; on SQLite the flag is ignored.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tweets_user_active_root',
+            'tweets',
+            ['user_id', sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=_ACTIVE_ROOT,
+            sqlite_where=_ACTIVE_ROOT,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tweets_user_active_root',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,47 @@
+"""add full-text search index on tweet content
+
+Revision ID: b4d8f2a61c03
+Revises: 7c3e9a1d5b2f
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8f2a61c03'
+down_revision: Union[str, None] = '7c3e9a1d5b2f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Other databases keep searching with ILIKE and need no index.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # CONCURRENTLY can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tweets_content_search',
+            'tweets',
+            [sa.text("to_tsvector('english'::regconfig, content)")],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tweets_content_search',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
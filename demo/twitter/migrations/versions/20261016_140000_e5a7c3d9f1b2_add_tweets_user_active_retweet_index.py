@@ -0,0 +1,60 @@
+"""add partial index for a user's live retweets, drop redundant user_id indexes
+
+Revision ID: e5a7c3d9f1b2
+Revises: b4d8f2a61c03
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c3d9f1b2'
+down_revision: Union[str, None] = 'b4d8f2a61c03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ACTIVE_RETWEET = sa.text("is_deleted = false AND retweet_of_id IS NOT NULL")
+
+# Single-column user_id indexes made redundant by the unique
+# (user_id, tweet_id) constraints on the same tables.
+_REDUNDANT_USER_INDEXES = (
+    ('ix_tweet_likes_user_id', 'tweet_likes'),
+    ('ix_bookmarks_user_id', 'bookmarks'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; on SQLite the flag is ignored.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tweets_user_active_retweet',
+            'tweets',
+            ['user_id', 'retweet_of_id'],
+            unique=False,
+            postgresql_where=_ACTIVE_RETWEET,
+            sqlite_where=_ACTIVE_RETWEET,
+            postgresql_concurrently=True,
+        )
+        for index_name, table_name in _REDUNDANT_USER_INDEXES:
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name in _REDUNDANT_USER_INDEXES:
+            op.create_index(
+                index_name,
+                table_name,
+                ['user_id'],
+                unique=False,
+                postgresql_concurrently=True,
+            )
+        op.drop_index(
+            'ix_tweets_user_active_retweet',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,60 @@
+"""add partial indexes for the global and explore feeds
+
+Revision ID: a3f6d8b2c4e7
+Revises: e5a7c3d9f1b2
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f6d8b2c4e7'
+down_revision: Union[str, None] = 'e5a7c3d9f1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ACTIVE_ROOT = sa.text("is_deleted = false AND parent_id IS NULL")
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; on SQLite the flag is ignored.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tweets_active_root_recent',
+            'tweets',
+            [sa.text('created_at DESC')],
+            unique=False,
+            postgresql_where=_ACTIVE_ROOT,
+            sqlite_where=_ACTIVE_ROOT,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tweets_active_root_engagement',
+            'tweets',
+            [
+                sa.text('(like_count + retweet_count + reply_count) DESC'),
+                sa.text('created_at DESC'),
+            ],
+            unique=False,
+            postgresql_where=_ACTIVE_ROOT,
+            sqlite_where=_ACTIVE_ROOT,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tweets_active_root_engagement',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_tweets_active_root_recent',
+            table_name='tweets',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,31 @@
+"""add a check constraint rejecting self-follows
+
+Revision ID: c8e2f4a6b1d9
+Revises: a3f6d8b2c4e7
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e2f4a6b1d9'
+down_revision: Union[str, None] = 'a3f6d8b2c4e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite can't add constraints in place; batch mode rebuilds the table there.
+    with op.batch_alter_table('follows') as batch_op:
+        batch_op.create_check_constraint(
+            op.f('ck_follows_no_self_follow'),
+            'follower_id <> following_id',
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('follows') as batch_op:
+        batch_op.drop_constraint(op.f('ck_follows_no_self_follow'), type_='check')
@@ -0,0 +1,69 @@
+"""add an FTS5 search table for tweet content on SQLite
+
+Revision ID: d2a9b7e4f6c1
+Revises: c8e2f4a6b1d9
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9b7e4f6c1'
+down_revision: Union[str, None] = 'c8e2f4a6b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PostgreSQL searches through the ix_tweets_content_search GIN index.
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    # tweets has no INTEGER PRIMARY KEY, so its rowid may be renumbered by
+    # VACUUM and cannot key the index. tweets_fts_rowids gives each tweet a
+    # stable FTS rowid, and its UNIQUE tweet_id lets the triggers seek to it
+    # rather than scan an UNINDEXED FTS column.
+    op.execute(
+        "CREATE TABLE tweets_fts_rowids (rowid INTEGER PRIMARY KEY, tweet_id NOT NULL UNIQUE)"
+    )
+    op.execute("CREATE VIRTUAL TABLE tweets_fts USING fts5(content)")
+    op.execute("INSERT INTO tweets_fts_rowids (tweet_id) SELECT id FROM tweets")
+    op.execute(
+        "INSERT INTO tweets_fts (rowid, content) "
+        "SELECT tweets_fts_rowids.rowid, tweets.content FROM tweets "
+        "JOIN tweets_fts_rowids ON tweets_fts_rowids.tweet_id = tweets.id"
+    )
+    op.execute(
+        "CREATE TRIGGER tweets_fts_insert AFTER INSERT ON tweets BEGIN "
+        "INSERT INTO tweets_fts_rowids (tweet_id) VALUES (new.id); "
+        "INSERT INTO tweets_fts (rowid, content) VALUES ("
+        "(SELECT rowid FROM tweets_fts_rowids WHERE tweet_id = new.id), new.content); "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER tweets_fts_delete AFTER DELETE ON tweets BEGIN "
+        "DELETE FROM tweets_fts WHERE rowid = "
+        "(SELECT rowid FROM tweets_fts_rowids WHERE tweet_id = old.id); "
+        "DELETE FROM tweets_fts_rowids WHERE tweet_id = old.id; "
+        "END"
+    )
+    op.execute(
+        "CREATE TRIGGER tweets_fts_update AFTER UPDATE OF content ON tweets BEGIN "
+        "UPDATE tweets_fts SET content = new.content WHERE rowid = "
+        "(SELECT rowid FROM tweets_fts_rowids WHERE tweet_id = old.id); "
+        "END"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute("DROP TRIGGER IF EXISTS tweets_fts_update")
+    op.execute("DROP TRIGGER IF EXISTS tweets_fts_delete")
+    op.execute("DROP TRIGGER IF EXISTS tweets_fts_insert")
+    op.execute("DROP TABLE IF EXISTS tweets_fts")
+    op.execute("DROP TABLE IF EXISTS tweets_fts_rowids")
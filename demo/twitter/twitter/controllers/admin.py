@@ -7,16 +7,20 @@ from litestar.exceptions import NotAuthorizedException
 from litestar.response import Template as TemplateResponse, Redirect
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from skrift.auth.guards import auth_guard, Permission
 from skrift.auth.services import get_user_permissions
 from skrift.admin.navigation import build_admin_nav, ADMIN_NAV_TAG
-from skrift.db.models.user import User
+from skrift.controllers.helpers import get_current_user
 from skrift.flash import flash_success, flash_error, get_flash_messages
 
 from twitter.models.tweet import Tweet
 from twitter.services import tweet_service
 
+MODERATION_LIST_LIMIT = 100
+MODERATION_BATCH_SIZE = 50
+
 
 class TwitterAdminController(Controller):
     path = "/admin/tweets"
@@ -27,8 +31,7 @@ class TwitterAdminController(Controller):
         if not user_id:
             raise NotAuthorizedException("Authentication required")
 
-        result = await db_session.execute(select(User).where(User.id == UUID(user_id)))
-        user = result.scalar_one_or_none()
+        user = await get_current_user(request, db_session)
         if not user:
             raise NotAuthorizedException("Invalid user session")
 
@@ -51,18 +54,24 @@ class TwitterAdminController(Controller):
     async def list_tweets(self, request: Request, db_session: AsyncSession) -> TemplateResponse:
         ctx = await self._get_admin_context(request, db_session)
 
-        result = await db_session.execute(
+        # Stream in batches so rows are buffered and rendered a batch at a
+        # time. Only the author is shown; the self-referential parent and
+        # retweet relationships would otherwise be selectin-loaded for
+        # nothing.
+        result = await db_session.stream_scalars(
             select(Tweet)
+            .options(lazyload(Tweet.parent), lazyload(Tweet.retweet_of))
             .where(Tweet.is_deleted == False)
             .order_by(Tweet.created_at.desc())
-            .limit(100)
+            .limit(MODERATION_LIST_LIMIT)
+            .execution_options(yield_per=MODERATION_BATCH_SIZE)
         )
-        tweets = list(result.scalars().all())
-
-        # Render content for display
+        tweets = []
         rendered = {}
-        for t in tweets:
-            rendered[t.id] = await tweet_service.render_tweet_content(t.content)
+        async for batch in result.partitions():
+            contents = await tweet_service.render_tweet_contents([t.content for t in batch])
+            rendered.update(zip((t.id for t in batch), contents))
+            tweets.extend(batch)
 
         flash_messages = get_flash_messages(request)
         return TemplateResponse(
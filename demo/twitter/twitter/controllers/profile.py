@@ -4,10 +4,12 @@ from uuid import UUID
 
 from litestar import Controller, Request, get, post
 from litestar.response import Template as TemplateResponse, Redirect
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from skrift.auth.guards import auth_guard
+from skrift.controllers.helpers import get_current_user, parse_uuid
+from skrift.db.cache import seed_instance
 from skrift.db.models.user import User
 from skrift.db.services.setting_service import get_cached_site_name, get_cached_site_base_url
 from skrift.flash import flash_success, flash_error, get_flash_messages
@@ -15,30 +17,32 @@ from skrift.hooks import hooks
 from skrift.seo import SEOMeta, OpenGraphMeta
 from skrift.forms import verify_csrf, csrf_field
 from twitter.hooks import TWEET_SEO_META, TWEET_OG_META
-from twitter.models.tweet import Tweet
-from twitter.services import tweet_service, like_service, follow_service, feed_service
-from twitter.services.feed_service import get_retweeted_tweet_ids
+from twitter.services import follow_service, feed_service
 
 
 class ProfileController(Controller):
     path = "/profile"
 
-    async def _get_user(self, request: Request, db_session: AsyncSession) -> User | None:
+    async def _get_viewer_and_profile(
+        self, request: Request, db_session: AsyncSession, profile_id: UUID
+    ) -> tuple[User | None, User | None]:
+        """Load the signed-in viewer and the profile owner in one query."""
         user_id = request.session.get("user_id")
-        if not user_id:
-            return None
-        result = await db_session.execute(select(User).where(User.id == UUID(user_id)))
-        return result.scalar_one_or_none()
-
-    async def _get_profile_user(self, db_session: AsyncSession, profile_id: UUID) -> User | None:
-        result = await db_session.execute(select(User).where(User.id == profile_id))
-        return result.scalar_one_or_none()
+        viewer_id = parse_uuid(user_id) if user_id else None
+        result = await db_session.execute(
+            select(User).where(User.id.in_({profile_id, viewer_id} - {None}))
+        )
+        users = {u.id: u for u in result.scalars()}
+        viewer = users.get(viewer_id)
+        if viewer:
+            # Later get_current_user calls in this request reuse it.
+            seed_instance(db_session, viewer)
+        return viewer, users.get(profile_id)
 
     @get("/{profile_id:uuid}")
     async def profile(self, request: Request, db_session: AsyncSession, profile_id: UUID) -> TemplateResponse:
-        user = await self._get_user(request, db_session)
+        user, profile_user = await self._get_viewer_and_profile(request, db_session, profile_id)
         flash_messages = get_flash_messages(request)
-        profile_user = await self._get_profile_user(db_session, profile_id)
 
         if not profile_user:
             return TemplateResponse(
@@ -47,38 +51,18 @@ class ProfileController(Controller):
                 status_code=404,
             )
 
-        tweets = await tweet_service.get_user_tweets(db_session, profile_id)
-        follower_count = await follow_service.get_follower_count(db_session, profile_id)
-        following_count = await follow_service.get_following_count(db_session, profile_id)
-
-        # Tweet count
-        tweet_count_result = await db_session.execute(
-            select(func.count()).select_from(Tweet).where(
-                Tweet.user_id == profile_id,
-                Tweet.is_deleted == False,
-                Tweet.parent_id.is_(None),
-            )
+        tweets, state = await feed_service.get_user_tweets(
+            db_session, profile_id, user.id if user else None
+        )
+        stats = await follow_service.get_profile_stats(
+            db_session, profile_id, user.id if user else None
         )
-        tweet_count = tweet_count_result.scalar() or 0
-
-        is_following = False
-        if user and user.id != profile_id:
-            is_following = await follow_service.is_following(db_session, user.id, profile_id)
-
-        # Tweet interaction state — use original tweet IDs for retweets
-        source_ids = [t.retweet_of.id if t.retweet_of else t.id for t in tweets]
-        liked_ids: set = set()
-        bookmarked_ids: set = set()
-        retweeted_ids: set = set()
-        if user:
-            liked_ids = await like_service.get_liked_tweet_ids(db_session, user.id, source_ids)
-            bookmarked_ids = await feed_service.get_bookmarked_tweet_ids(db_session, user.id, source_ids)
-            retweeted_ids = await get_retweeted_tweet_ids(db_session, user.id, source_ids)
-
-        rendered = {}
-        for t in tweets:
-            source = t.retweet_of if t.retweet_of else t
-            rendered[source.id] = await tweet_service.render_tweet_content(source.content)
+        tweet_count = stats.tweet_count
+        follower_count = stats.follower_count
+        following_count = stats.following_count
+        is_following = stats.is_following
+
+        cards = await feed_service.build_tweet_cards(tweets, state)
 
         # SEO
         site_name = get_cached_site_name()
@@ -108,15 +92,11 @@ class ProfileController(Controller):
             context={
                 "user": user,
                 "profile_user": profile_user,
-                "tweets": tweets,
+                "tweets": cards,
                 "tweet_count": tweet_count,
                 "follower_count": follower_count,
                 "following_count": following_count,
                 "is_following": is_following,
-                "liked_ids": liked_ids,
-                "bookmarked_ids": bookmarked_ids,
-                "retweeted_ids": retweeted_ids,
-                "rendered_content": rendered,
                 "csrf_field": csrf_field(request) if user else "",
                 "seo_meta": seo_meta,
                 "og_meta": og_meta,
@@ -129,7 +109,7 @@ class ProfileController(Controller):
         if not await verify_csrf(request):
             flash_error(request, "Invalid request. Please try again.")
             return Redirect(path=f"/profile/{profile_id}")
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         result = await follow_service.toggle_follow(db_session, user.id, profile_id)
         if result:
             flash_success(request, "Followed!")
@@ -139,9 +119,8 @@ class ProfileController(Controller):
 
     @get("/{profile_id:uuid}/followers")
     async def followers(self, request: Request, db_session: AsyncSession, profile_id: UUID) -> TemplateResponse:
-        user = await self._get_user(request, db_session)
+        user, profile_user = await self._get_viewer_and_profile(request, db_session, profile_id)
         flash_messages = get_flash_messages(request)
-        profile_user = await self._get_profile_user(db_session, profile_id)
 
         if not profile_user:
             return TemplateResponse(
@@ -165,9 +144,8 @@ class ProfileController(Controller):
 
     @get("/{profile_id:uuid}/following")
     async def following(self, request: Request, db_session: AsyncSession, profile_id: UUID) -> TemplateResponse:
-        user = await self._get_user(request, db_session)
+        user, profile_user = await self._get_viewer_and_profile(request, db_session, profile_id)
         flash_messages = get_flash_messages(request)
-        profile_user = await self._get_profile_user(db_session, profile_id)
 
         if not profile_user:
             return TemplateResponse(
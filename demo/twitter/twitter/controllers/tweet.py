@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from uuid import UUID
 
 from litestar import Controller, Request, get, post
+from litestar.background_tasks import BackgroundTask
 from litestar.response import Template as TemplateResponse, Redirect
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from skrift.auth.guards import auth_guard
-from skrift.db.models.user import User
+from skrift.controllers.helpers import get_current_user
 from skrift.db.services.setting_service import get_cached_site_name, get_cached_site_base_url
 from skrift.flash import flash_success, flash_error, get_flash_messages
 from skrift.hooks import hooks
@@ -19,29 +21,41 @@ from skrift.forms import Form, verify_csrf, csrf_field
 from twitter.forms import ComposeTweetForm, ReplyForm
 from twitter.hooks import TWEET_SEO_META, TWEET_OG_META
 from twitter.services import tweet_service, like_service, feed_service
-from twitter.services.feed_service import get_retweeted_tweet_ids
+
+logger = logging.getLogger(__name__)
+
+
+async def _send_notification(notify, *args, **kwargs) -> None:
+    """Deliver a notification after the response has gone out.
+
+    The write it reports on is already committed, so a delivery failure is
+    logged rather than surfaced to the user.
+    """
+    try:
+        await notify(*args, **kwargs)
+    except Exception:
+        logger.exception("Failed to deliver tweet notification")
+
+
+def _notify_later(notify, *args, **kwargs) -> BackgroundTask:
+    return BackgroundTask(_send_notification, notify, *args, **kwargs)
 
 
 class TweetController(Controller):
     path = "/tweet"
 
-    async def _get_user(self, request: Request, db_session: AsyncSession) -> User | None:
-        user_id = request.session.get("user_id")
-        if not user_id:
-            return None
-        result = await db_session.execute(select(User).where(User.id == UUID(user_id)))
-        return result.scalar_one_or_none()
-
     @post("/compose", guards=[auth_guard])
     async def compose(self, request: Request, db_session: AsyncSession) -> Redirect:
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         form = Form(ComposeTweetForm, request)
+        background = None
 
         if await form.validate():
             tweet = await tweet_service.create_tweet(db_session, user.id, form.data.content)
             flash_success(request, "Tweet posted!")
             rendered = await tweet_service.render_tweet_content(tweet.content)
-            await notify_broadcast(
+            background = _notify_later(
+                notify_broadcast,
                 "new_tweet",
                 tweet_id=str(tweet.id),
                 user_id=str(tweet.user_id),
@@ -54,50 +68,43 @@ class TweetController(Controller):
             errors = "; ".join(form.errors.values())
             flash_error(request, f"Could not post tweet: {errors}")
 
-        return Redirect(path="/")
+        return Redirect(path="/", background=background)
 
     @get("/{tweet_id:uuid}")
     async def detail(self, request: Request, db_session: AsyncSession, tweet_id: UUID) -> TemplateResponse:
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         flash_messages = get_flash_messages(request)
 
-        tweet = await tweet_service.get_tweet_by_id(db_session, tweet_id)
+        # Tweet, replies and like/bookmark/retweet state in one query
+        tweet, replies, state = await feed_service.get_tweet_thread(
+            db_session, tweet_id, user.id if user else None
+        )
         if not tweet:
             flash_error(request, "Tweet not found")
             return Redirect(path="/")
 
-        replies = await tweet_service.get_tweet_replies(db_session, tweet_id)
         reply_form = Form(ReplyForm, request)
-        rendered_content = await tweet_service.render_tweet_content(tweet.content)
-
-        # Render reply content
-        rendered_replies = {}
-        for r in replies:
-            rendered_replies[r.id] = await tweet_service.render_tweet_content(r.content)
-
-        # Check like/bookmark/retweet state
-        liked_ids: set = set()
-        bookmarked_ids: set = set()
-        retweeted_ids: set = set()
-        all_ids = [tweet.id] + [r.id for r in replies]
-        if user:
-            liked_ids = await like_service.get_liked_tweet_ids(db_session, user.id, all_ids)
-            bookmarked_ids = await feed_service.get_bookmarked_tweet_ids(db_session, user.id, all_ids)
-            retweeted_ids = await get_retweeted_tweet_ids(db_session, user.id, all_ids)
-
-        # SEO
+        # Neither touches the session, so the tweet body renders alongside
+        # the reply cards instead of ahead of them
+        rendered_content, reply_cards = await asyncio.gather(
+            tweet_service.render_tweet_content(tweet.content),
+            feed_service.build_tweet_cards(replies, state),
+        )
+
+        # SEO: shared pieces computed once for both meta objects
         site_name = get_cached_site_name()
         base_url = get_cached_site_base_url() or str(request.base_url).rstrip("/")
-        author_name = tweet.user.name or "User"
-        description = tweet.content[:160]
-        short_content = tweet.content[:60]
-        if len(tweet.content) > 60:
-            short_content += "..."
+        author = tweet.user
+        author_name = author.name or "User"
+        content = tweet.content
+        tweet_url = f"{base_url}/tweet/{tweet.id}"
+        description = content[:160]
+        short_content = content[:60] + "..." if len(content) > 60 else content
 
         seo_meta = SEOMeta(
             title=f'{author_name} on {site_name}: "{short_content}"',
             description=description,
-            canonical_url=f"{base_url}/tweet/{tweet.id}",
+            canonical_url=tweet_url,
             robots=None,
         )
         seo_meta = await hooks.apply_filters(TWEET_SEO_META, seo_meta, tweet)
@@ -105,8 +112,8 @@ class TweetController(Controller):
         og_meta = OpenGraphMeta(
             title=f'{author_name}: "{short_content}"',
             description=description,
-            image=tweet.user.picture_url,
-            url=f"{base_url}/tweet/{tweet.id}",
+            image=author.picture_url,
+            url=tweet_url,
             site_name=site_name,
             type="article",
         )
@@ -117,12 +124,12 @@ class TweetController(Controller):
             context={
                 "user": user,
                 "tweet": tweet,
-                "replies": replies,
+                "replies": reply_cards,
                 "reply_form": reply_form,
-                "rendered_content": {tweet.id: rendered_content, **rendered_replies},
-                "liked_ids": liked_ids,
-                "bookmarked_ids": bookmarked_ids,
-                "retweeted_ids": retweeted_ids,
+                "rendered_content": {tweet.id: rendered_content},
+                "liked_ids": state.liked_ids,
+                "bookmarked_ids": state.bookmarked_ids,
+                "retweeted_ids": state.retweeted_ids,
                 "csrf_field": csrf_field(request) if user else "",
                 "seo_meta": seo_meta,
                 "og_meta": og_meta,
@@ -132,17 +139,21 @@ class TweetController(Controller):
 
     @post("/{tweet_id:uuid}/reply", guards=[auth_guard])
     async def reply(self, request: Request, db_session: AsyncSession, tweet_id: UUID) -> Redirect:
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         form = Form(ReplyForm, request)
+        background = None
 
         if await form.validate():
-            reply_tweet = await tweet_service.create_tweet(
+            reply = await tweet_service.create_tweet(
                 db_session, user.id, form.data.content, parent_id=tweet_id
             )
             flash_success(request, "Reply posted!")
-            if reply_tweet.parent and str(reply_tweet.parent.user_id) != str(user.id):
-                await notify_user(
-                    str(reply_tweet.parent.user_id),
+            # create_tweet already loaded the parent onto the reply
+            parent = reply.parent
+            if parent and not parent.is_deleted and parent.user_id != user.id:
+                background = _notify_later(
+                    notify_user,
+                    str(parent.user_id),
                     "generic",
                     title=f"{user.name} replied to your tweet",
                     message=form.data.content[:100],
@@ -151,7 +162,7 @@ class TweetController(Controller):
             errors = "; ".join(form.errors.values())
             flash_error(request, f"Could not post reply: {errors}")
 
-        return Redirect(path=f"/tweet/{tweet_id}")
+        return Redirect(path=f"/tweet/{tweet_id}", background=background)
 
     @post("/{tweet_id:uuid}/like", guards=[auth_guard])
     async def like(self, request: Request, db_session: AsyncSession, tweet_id: UUID) -> Redirect:
@@ -159,19 +170,22 @@ class TweetController(Controller):
         if not await verify_csrf(request):
             flash_error(request, "Invalid request. Please try again.")
             return Redirect(path=referer)
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         liked = await like_service.toggle_like(db_session, user.id, tweet_id)
         flash_success(request, "Liked!" if liked else "Unliked")
+        background = None
         if liked:
-            tweet = await tweet_service.get_tweet_by_id(db_session, tweet_id)
-            if tweet and str(tweet.user_id) != str(user.id):
-                await notify_user(
-                    str(tweet.user_id),
+            preview = await tweet_service.get_tweet_preview(db_session, tweet_id)
+            if preview and preview[0] != user.id:
+                author_id, content = preview
+                background = _notify_later(
+                    notify_user,
+                    str(author_id),
                     "generic",
                     title=f"{user.name} liked your tweet",
-                    message=tweet.content[:100],
+                    message=content[:100],
                 )
-        return Redirect(path=referer)
+        return Redirect(path=referer, background=background)
 
     @post("/{tweet_id:uuid}/retweet", guards=[auth_guard])
     async def retweet(self, request: Request, db_session: AsyncSession, tweet_id: UUID) -> Redirect:
@@ -179,12 +193,14 @@ class TweetController(Controller):
         if not await verify_csrf(request):
             flash_error(request, "Invalid request. Please try again.")
             return Redirect(path=referer)
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         result = await tweet_service.create_retweet(db_session, user.id, tweet_id)
+        background = None
         if result:
             flash_success(request, "Retweeted!")
-            if result.retweet_of and str(result.retweet_of.user_id) != str(user.id):
-                await notify_user(
+            if result.retweet_of and result.retweet_of.user_id != user.id:
+                background = _notify_later(
+                    notify_user,
                     str(result.retweet_of.user_id),
                     "generic",
                     title=f"{user.name} retweeted your tweet",
@@ -192,7 +208,7 @@ class TweetController(Controller):
                 )
         else:
             flash_error(request, "Already retweeted or tweet not found")
-        return Redirect(path=referer)
+        return Redirect(path=referer, background=background)
 
     @post("/{tweet_id:uuid}/bookmark", guards=[auth_guard])
     async def bookmark(self, request: Request, db_session: AsyncSession, tweet_id: UUID) -> Redirect:
@@ -200,7 +216,7 @@ class TweetController(Controller):
         if not await verify_csrf(request):
             flash_error(request, "Invalid request. Please try again.")
             return Redirect(path=referer)
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         saved = await feed_service.toggle_bookmark(db_session, user.id, tweet_id)
         flash_success(request, "Bookmarked!" if saved else "Bookmark removed")
         return Redirect(path=referer)
@@ -210,7 +226,7 @@ class TweetController(Controller):
         if not await verify_csrf(request):
             flash_error(request, "Invalid request. Please try again.")
             return Redirect(path="/")
-        user = await self._get_user(request, db_session)
+        user = await get_current_user(request, db_session)
         is_owner = await tweet_service.check_tweet_ownership(db_session, tweet_id, user.id)
         if not is_owner:
             flash_error(request, "You can only delete your own tweets")
@@ -18,27 +18,37 @@ TWEET_FEED_QUERY = "tweet_feed_query"
 TWEET_SEO_META = "tweet_seo_meta"
 TWEET_OG_META = "tweet_og_meta"
 
-# URL pattern
-_URL_RE = re.compile(r'(https?://[^\s<>"\']+)')
-# @mention pattern
-_MENTION_RE = re.compile(r'@(\w+)')
-# #hashtag pattern
-_HASHTAG_RE = re.compile(r'#(\w+)')
+# URLs, @mentions and #hashtags in one pass. Character references left by
+# escaping (``&#x27;``) match first so they aren't mistaken for hashtags,
+# and text already inside a link isn't rescanned. The leading lookahead
+# lets the engine skip ahead to candidate characters instead of trying
+# every alternative at every position of plain text.
+_LINKIFY_RE = re.compile(
+    r'(?=[&h@#])(?:'
+    r'(?P<entity>&#?\w+;)'
+    r'|(?P<url>https?://[^\s<>"\']+)'
+    r'|@(?P<mention>\w+)'
+    r'|#(?P<hashtag>\w+)'
+    r')'
+)
+
+
+def _linkify_match(match: re.Match) -> str:
+    kind = match.lastgroup
+    value = match.group(kind)
+    if kind == "url":
+        return f'<a href="{value}" rel="nofollow noopener" target="_blank">{value}</a>'
+    if kind == "mention":
+        return f'<a href="/profile/{value}">@{value}</a>'
+    if kind == "hashtag":
+        return f'<a href="/search?q=%23{value}">#{value}</a>'
+    return value
 
 
 @filter_hook(TWEET_CONTENT_RENDER, priority=10)
-def linkify_urls(content: str) -> str:
-    """Convert URLs to clickable links. Content is pre-escaped by render_tweet_content."""
-    return _URL_RE.sub(r'<a href="\1" rel="nofollow noopener" target="_blank">\1</a>', content)
+def linkify(content: str) -> str:
+    """Convert URLs, @mentions and #hashtags to links.
 
-
-@filter_hook(TWEET_CONTENT_RENDER, priority=20)
-def linkify_mentions(content: str) -> str:
-    """Convert @username mentions to profile links."""
-    return _MENTION_RE.sub(r'<a href="/profile/\1">@\1</a>', content)
-
-
-@filter_hook(TWEET_CONTENT_RENDER, priority=30)
-def linkify_hashtags(content: str) -> str:
-    """Convert #hashtags to search links."""
-    return _HASHTAG_RE.sub(r'<a href="/search?q=%23\1">#\1</a>', content)
+    Content is pre-escaped by render_tweet_content.
+    """
+    return _LINKIFY_RE.sub(_linkify_match, content)
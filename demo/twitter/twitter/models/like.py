@@ -12,5 +12,7 @@ class Like(Base):
         UniqueConstraint("user_id", "tweet_id", name="uq_tweet_likes_user_tweet"),
     )
 
-    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    # No standalone user_id index: the unique (user_id, tweet_id) index
+    # covers user_id lookups and answers interaction checks index-only.
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     tweet_id: Mapped[UUID] = mapped_column(ForeignKey("tweets.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from sqlalchemy import Text, Boolean, ForeignKey, Integer
+from sqlalchemy import Text, Boolean, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from skrift.db.base import Base
@@ -8,6 +8,48 @@ from skrift.db.base import Base
 
 class Tweet(Base):
     __tablename__ = "tweets"
+    __table_args__ = (
+        # Profile timelines and tweet counts: a user's live top-level tweets,
+        # newest first.
+        Index(
+            "ix_tweets_user_active_root",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false AND parent_id IS NULL"),
+            sqlite_where=text("is_deleted = false AND parent_id IS NULL"),
+        ),
+        # Global feed: all live top-level tweets, newest first.
+        Index(
+            "ix_tweets_active_root_recent",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false AND parent_id IS NULL"),
+            sqlite_where=text("is_deleted = false AND parent_id IS NULL"),
+        ),
+        # Explore feed: same rows by engagement; the expression must match
+        # feed_service.get_explore_feed's ORDER BY.
+        Index(
+            "ix_tweets_active_root_engagement",
+            text("(like_count + retweet_count + reply_count) DESC"),
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false AND parent_id IS NULL"),
+            sqlite_where=text("is_deleted = false AND parent_id IS NULL"),
+        ),
+        # "Has this user retweeted X" checks behind the retweet button.
+        Index(
+            "ix_tweets_user_active_retweet",
+            "user_id",
+            "retweet_of_id",
+            postgresql_where=text("is_deleted = false AND retweet_of_id IS NOT NULL"),
+            sqlite_where=text("is_deleted = false AND retweet_of_id IS NOT NULL"),
+        ),
+        # Full-text search (PostgreSQL only); must match the expression
+        # tweet_service.search_tweets queries with.
+        Index(
+            "ix_tweets_content_search",
+            text("to_tsvector('english'::regconfig, content)"),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     user: Mapped["User"] = relationship("User", foreign_keys=[user_id], lazy="selectin")
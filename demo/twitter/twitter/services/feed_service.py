@@ -1,104 +1,232 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select, and_, delete
+from markupsafe import Markup
+
+from sqlalchemy import Select, select, and_, case, delete, exists, func, literal, or_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased
 
+from skrift.hooks import action
+from twitter.hooks import AFTER_TWEET_DELETE, AFTER_TWEET_SAVE
 from twitter.models.tweet import Tweet
 from twitter.models.bookmark import Bookmark
-from twitter.services.follow_service import get_following_ids
+from twitter.models.follow import Follow
+from twitter.models.like import Like
+from twitter.services.tweet_service import (
+    NEWEST_FIRST,
+    TWEET_LOAD_OPTIONS,
+    created_before,
+    insert_ignoring_duplicates,
+    render_tweet_contents,
+)
+
+ANONYMOUS_LIST_TTL = 30.0
+MAX_ANONYMOUS_LIST_ENTRIES = 256
+_anonymous_list_cache: OrderedDict[tuple[str, ...], tuple[float, Markup]] = OrderedDict()
+
+
+@dataclass(frozen=True, slots=True)
+class InteractionState:
+    """Which of a batch of tweets the viewer has liked, bookmarked, retweeted."""
+
+    liked_ids: set[UUID]
+    bookmarked_ids: set[UUID]
+    retweeted_ids: set[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class TweetCard:
+    """Template-ready snapshot of one tweet in a list.
+
+    Retweets are flattened onto their original: ``source_id``, the author
+    fields, content and counts all describe the retweeted tweet, while
+    ``id`` and ``user_id`` still identify the retweet itself.
+    """
+
+    id: UUID
+    user_id: UUID
+    is_retweet: bool
+    retweeter_name: str | None
+    source_id: UUID
+    author_id: UUID
+    author_name: str | None
+    author_picture_url: str | None
+    created_at: datetime
+    content: Markup
+    reply_count: int
+    retweet_count: int
+    like_count: int
+    liked: bool
+    bookmarked: bool
+    retweeted: bool
+
 
+async def build_tweet_cards(tweets: list[Tweet], state: InteractionState) -> list[TweetCard]:
+    """Render content and copy what the tweet card needs off the ORM objects.
 
-def _tweet_load_options():
-    """Eager-load options to avoid lazy loads in templates."""
-    return [selectinload(Tweet.retweet_of).selectinload(Tweet.user)]
+    Templates then read plain slots instead of going through SQLAlchemy's
+    instrumented attributes for every field of every card.
+    """
+    sources = {}
+    for t in tweets:
+        source = t.retweet_of or t
+        sources[source.id] = source
+    contents = await render_tweet_contents([s.content for s in sources.values()])
+    rendered = dict(zip(sources, contents))
+
+    cards = []
+    for t in tweets:
+        source = t.retweet_of or t
+        author = source.user or t.user
+        cards.append(
+            TweetCard(
+                id=t.id,
+                user_id=t.user_id,
+                is_retweet=t.retweet_of_id is not None,
+                retweeter_name=t.user.name,
+                source_id=source.id,
+                author_id=author.id,
+                author_name=author.name,
+                author_picture_url=author.picture_url,
+                created_at=source.created_at,
+                content=rendered[source.id],
+                reply_count=source.reply_count,
+                retweet_count=source.retweet_count,
+                like_count=source.like_count,
+                liked=source.id in state.liked_ids,
+                bookmarked=source.id in state.bookmarked_ids,
+                retweeted=source.id in state.retweeted_ids,
+            )
+        )
+    return cards
 
 
 async def get_timeline(
     db_session: AsyncSession,
     user_id: UUID,
     limit: int = 50,
-    offset: int = 0,
-) -> list[Tweet]:
-    """Get timeline: tweets from users the current user follows + own tweets."""
-    following_ids = await get_following_ids(db_session, user_id)
-    following_ids.add(user_id)
+    before: tuple[datetime, UUID] | None = None,
+) -> tuple[list[Tweet], InteractionState]:
+    """Get timeline: tweets from users the current user follows + own tweets.
 
-    result = await db_session.execute(
+    The user's like/bookmark/retweet state for the page is returned with it.
+    Pass the last tweet's ``(created_at, id)`` as ``before`` for the next page.
+    """
+    # Resolve the followed users inside the query rather than in a separate
+    # round trip, which also keeps the parameter list size independent of
+    # how many accounts the user follows.
+    following_ids = select(Follow.following_id).where(Follow.follower_id == user_id)
+
+    return await _fetch_with_state(
+        db_session,
         select(Tweet)
-        .options(*_tweet_load_options())
+        .options(*TWEET_LOAD_OPTIONS)
         .where(
             and_(
-                Tweet.user_id.in_(following_ids),
+                or_(Tweet.user_id == user_id, Tweet.user_id.in_(following_ids)),
                 Tweet.is_deleted == False,
                 Tweet.parent_id.is_(None),
+                *created_before(before),
             )
         )
-        .order_by(Tweet.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .order_by(*NEWEST_FIRST)
+        .limit(limit),
+        user_id,
     )
-    return list(result.scalars().all())
 
 
 async def get_global_feed(
     db_session: AsyncSession,
+    viewer_id: UUID | None = None,
     limit: int = 50,
-    offset: int = 0,
-) -> list[Tweet]:
+    before: tuple[datetime, UUID] | None = None,
+) -> tuple[list[Tweet], InteractionState]:
     """Get all tweets in reverse chronological order."""
-    result = await db_session.execute(
+    return await _fetch_with_state(
+        db_session,
         select(Tweet)
-        .options(*_tweet_load_options())
-        .where(and_(Tweet.is_deleted == False, Tweet.parent_id.is_(None)))
-        .order_by(Tweet.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .options(*TWEET_LOAD_OPTIONS)
+        .where(
+            and_(Tweet.is_deleted == False, Tweet.parent_id.is_(None), *created_before(before))
+        )
+        .order_by(*NEWEST_FIRST)
+        .limit(limit),
+        viewer_id,
+    )
+
+
+async def get_user_tweets(
+    db_session: AsyncSession,
+    user_id: UUID,
+    viewer_id: UUID | None = None,
+    limit: int = 50,
+    before: tuple[datetime, UUID] | None = None,
+) -> tuple[list[Tweet], InteractionState]:
+    """Get a user's own top-level tweets, newest first, for their profile."""
+    return await _fetch_with_state(
+        db_session,
+        select(Tweet)
+        .options(*TWEET_LOAD_OPTIONS)
+        .where(
+            and_(
+                Tweet.user_id == user_id,
+                Tweet.is_deleted == False,
+                Tweet.parent_id.is_(None),
+                *created_before(before),
+            )
+        )
+        .order_by(*NEWEST_FIRST)
+        .limit(limit),
+        viewer_id,
     )
-    return list(result.scalars().all())
 
 
 async def get_explore_feed(
     db_session: AsyncSession,
+    viewer_id: UUID | None = None,
     limit: int = 50,
     offset: int = 0,
-) -> list[Tweet]:
+) -> tuple[list[Tweet], InteractionState]:
     """Get tweets sorted by engagement (likes + retweets + replies)."""
-    result = await db_session.execute(
+    return await _fetch_with_state(
+        db_session,
         select(Tweet)
-        .options(*_tweet_load_options())
+        .options(*TWEET_LOAD_OPTIONS)
         .where(and_(Tweet.is_deleted == False, Tweet.parent_id.is_(None)))
         .order_by(
             (Tweet.like_count + Tweet.retweet_count + Tweet.reply_count).desc(),
             Tweet.created_at.desc(),
         )
         .offset(offset)
-        .limit(limit)
+        .limit(limit),
+        viewer_id,
     )
-    return list(result.scalars().all())
 
 
 async def toggle_bookmark(db_session: AsyncSession, user_id: UUID, tweet_id: UUID) -> bool:
-    """Toggle bookmark. Returns True if bookmarked, False if removed."""
-    existing = await db_session.execute(
-        select(Bookmark).where(
-            and_(Bookmark.user_id == user_id, Bookmark.tweet_id == tweet_id)
-        )
-    )
-    bookmark = existing.scalar_one_or_none()
+    """Toggle bookmark. Returns True if bookmarked, False if removed.
 
-    if bookmark:
-        await db_session.execute(
-            delete(Bookmark).where(
-                and_(Bookmark.user_id == user_id, Bookmark.tweet_id == tweet_id)
-            )
-        )
+    The delete runs first and reports whether it removed anything, so a
+    toggle is one statement instead of a lookup followed by a write.
+    """
+    removed = await db_session.scalar(
+        delete(Bookmark)
+        .where(and_(Bookmark.user_id == user_id, Bookmark.tweet_id == tweet_id))
+        .returning(Bookmark.id)
+    )
+    if removed is not None:
         await db_session.commit()
         return False
-    else:
-        db_session.add(Bookmark(user_id=user_id, tweet_id=tweet_id))
-        await db_session.commit()
-        return True
+
+    await insert_ignoring_duplicates(
+        db_session, Bookmark, ["user_id", "tweet_id"], user_id=user_id, tweet_id=tweet_id
+    )
+    await db_session.commit()
+    return True
 
 
 async def get_bookmarked_tweets(
@@ -106,47 +234,178 @@ async def get_bookmarked_tweets(
     user_id: UUID,
     limit: int = 50,
     offset: int = 0,
-) -> list[Tweet]:
-    result = await db_session.execute(
+) -> tuple[list[Tweet], InteractionState]:
+    return await _fetch_with_state(
+        db_session,
         select(Tweet)
-        .options(*_tweet_load_options())
+        .options(*TWEET_LOAD_OPTIONS)
         .join(Bookmark, Bookmark.tweet_id == Tweet.id)
         .where(
             and_(Bookmark.user_id == user_id, Tweet.is_deleted == False)
         )
         .order_by(Bookmark.created_at.desc())
         .offset(offset)
-        .limit(limit)
+        .limit(limit),
+        user_id,
     )
-    return list(result.scalars().all())
 
 
-async def get_bookmarked_tweet_ids(
-    db_session: AsyncSession, user_id: UUID, tweet_ids: list[UUID]
-) -> set[UUID]:
-    if not tweet_ids:
-        return set()
-    result = await db_session.execute(
-        select(Bookmark.tweet_id).where(
-            and_(Bookmark.user_id == user_id, Bookmark.tweet_id.in_(tweet_ids))
+async def get_tweet_thread(
+    db_session: AsyncSession,
+    tweet_id: UUID,
+    viewer_id: UUID | None = None,
+    reply_limit: int = 50,
+) -> tuple[Tweet | None, list[Tweet], InteractionState]:
+    """Get a tweet, its oldest replies, and the viewer's state for all of them.
+
+    The tweet sorts ahead of its replies, so a single query covers what
+    the detail page needs. State is keyed by each row's own ID, since the
+    detail page acts on the tweet shown rather than a retweet's original.
+    """
+    is_root = Tweet.id == tweet_id
+    rows, state = await _fetch_with_state(
+        db_session,
+        select(Tweet)
+        .options(*TWEET_LOAD_OPTIONS)
+        .where(
+            and_(
+                or_(is_root, Tweet.parent_id == tweet_id),
+                Tweet.is_deleted == False,
+            )
         )
+        .order_by(case((is_root, 0), else_=1), Tweet.created_at.asc())
+        .limit(reply_limit + 1),
+        viewer_id,
+        source_expr=Tweet.id,
     )
-    return set(result.scalars().all())
+    if not rows or rows[0].id != tweet_id:
+        return None, [], InteractionState(set(), set(), set())
+    return rows[0], rows[1:], state
 
 
-async def get_retweeted_tweet_ids(
+async def get_interaction_state(
     db_session: AsyncSession, user_id: UUID, tweet_ids: list[UUID]
-) -> set[UUID]:
-    """Return which of the given tweet IDs the user has retweeted."""
+) -> InteractionState:
+    """Look up like/bookmark/retweet state for the given tweet IDs.
+
+    One ``UNION ALL`` query tagged with the interaction kind covers all
+    three, for lists that weren't loaded through ``_fetch_with_state``.
+    """
+    state = InteractionState(set(), set(), set())
     if not tweet_ids:
-        return set()
+        return state
+
     result = await db_session.execute(
-        select(Tweet.retweet_of_id).where(
+        union_all(
+            select(Like.tweet_id, literal("like")).where(
+                and_(Like.user_id == user_id, Like.tweet_id.in_(tweet_ids))
+            ),
+            select(Bookmark.tweet_id, literal("bookmark")).where(
+                and_(Bookmark.user_id == user_id, Bookmark.tweet_id.in_(tweet_ids))
+            ),
+            select(Tweet.retweet_of_id, literal("retweet")).where(
+                and_(
+                    Tweet.user_id == user_id,
+                    Tweet.retweet_of_id.in_(tweet_ids),
+                    Tweet.is_deleted == False,
+                )
+            ),
+        )
+    )
+    buckets = {
+        "like": state.liked_ids,
+        "bookmark": state.bookmarked_ids,
+        "retweet": state.retweeted_ids,
+    }
+    for tweet_id, kind in result.all():
+        buckets[kind].add(tweet_id)
+    return state
+
+
+def _interaction_columns(user_id: UUID, source_expr=None) -> list:
+    """The tweet's source ID plus correlated ``EXISTS`` interaction flags.
+
+    Retweets resolve to their original by default, matching what the tweet
+    card shows, so the source ID comes back as a column instead of being
+    derived per row in Python.
+    """
+    if source_expr is None:
+        source_expr = func.coalesce(Tweet.retweet_of_id, Tweet.id)
+    retweet = aliased(Tweet)
+    return [
+        source_expr.label("source_id"),
+        exists()
+        .where(and_(Like.user_id == user_id, Like.tweet_id == source_expr))
+        .correlate(Tweet)
+        .label("liked"),
+        exists()
+        .where(and_(Bookmark.user_id == user_id, Bookmark.tweet_id == source_expr))
+        .correlate(Tweet)
+        .label("bookmarked"),
+        exists()
+        .where(
             and_(
-                Tweet.user_id == user_id,
-                Tweet.retweet_of_id.in_(tweet_ids),
-                Tweet.is_deleted == False,
+                retweet.user_id == user_id,
+                retweet.retweet_of_id == source_expr,
+                retweet.is_deleted == False,
             )
         )
-    )
-    return set(result.scalars().all())
+        .correlate(Tweet)
+        .label("retweeted"),
+    ]
+
+
+async def _fetch_with_state(
+    db_session: AsyncSession, query: Select, viewer_id: UUID | None, source_expr=None
+) -> tuple[list[Tweet], InteractionState]:
+    """Run a tweet list query, folding in the viewer's interaction flags."""
+    state = InteractionState(set(), set(), set())
+    if viewer_id is None:
+        result = await db_session.execute(query)
+        return result.scalars().all(), state
+
+    result = await db_session.execute(query.add_columns(*_interaction_columns(viewer_id, source_expr)))
+    tweets = []
+    for tweet, source_id, liked, bookmarked, retweeted in result.all():
+        tweets.append(tweet)
+        if liked:
+            state.liked_ids.add(source_id)
+        if bookmarked:
+            state.bookmarked_ids.add(source_id)
+        if retweeted:
+            state.retweeted_ids.add(source_id)
+    return tweets, state
+
+
+def get_cached_anonymous_list(key: tuple[str, ...]) -> Markup | None:
+    """Return the rendered tweet list cached for logged-out viewers, if fresh.
+
+    Anonymous feeds carry no per-viewer state, so every logged-out request
+    for the same feed renders the same list.
+    """
+    entry = _anonymous_list_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, html = entry
+    if expires_at <= time.monotonic():
+        del _anonymous_list_cache[key]
+        return None
+    _anonymous_list_cache.move_to_end(key)
+    return html
+
+
+def cache_anonymous_list(key: tuple[str, ...], html: Markup) -> None:
+    _anonymous_list_cache[key] = (time.monotonic() + ANONYMOUS_LIST_TTL, html)
+    _anonymous_list_cache.move_to_end(key)
+    if len(_anonymous_list_cache) > MAX_ANONYMOUS_LIST_ENTRIES:
+        _anonymous_list_cache.popitem(last=False)
+
+
+@action(AFTER_TWEET_SAVE)
+@action(AFTER_TWEET_DELETE)
+async def invalidate_anonymous_lists(tweet: Tweet, **kwargs) -> None:
+    """Drop cached anonymous lists when tweets are posted or deleted.
+
+    Like and retweet counts are left to go stale until the TTL expires.
+    """
+    _anonymous_list_cache.clear()
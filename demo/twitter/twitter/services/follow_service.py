@@ -1,12 +1,26 @@
+from dataclasses import dataclass
 from uuid import UUID
 
-from sqlalchemy import select, and_, delete, func
+from sqlalchemy import select, and_, delete, exists, false, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
 
 from skrift.db.models.user import User
 from skrift.hooks import hooks
 from twitter.hooks import AFTER_USER_FOLLOW, AFTER_USER_UNFOLLOW
 from twitter.models.follow import Follow
+from twitter.models.tweet import Tweet
+from twitter.services.tweet_service import insert_ignoring_duplicates
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileStats:
+    """Counts shown on a profile page, plus whether the viewer follows it."""
+
+    tweet_count: int
+    follower_count: int
+    following_count: int
+    is_following: bool
 
 
 async def toggle_follow(db_session: AsyncSession, follower_id: UUID, following_id: UUID) -> bool:
@@ -14,59 +28,83 @@ async def toggle_follow(db_session: AsyncSession, follower_id: UUID, following_i
     if follower_id == following_id:
         return False
 
-    existing = await db_session.execute(
-        select(Follow).where(
-            and_(Follow.follower_id == follower_id, Follow.following_id == following_id)
-        )
+    # Delete first and let RETURNING say whether a follow existed, rather
+    # than looking it up before writing.
+    removed = await db_session.scalar(
+        delete(Follow)
+        .where(and_(Follow.follower_id == follower_id, Follow.following_id == following_id))
+        .returning(Follow.id)
     )
-    follow = existing.scalar_one_or_none()
-
-    if follow:
-        await db_session.execute(
-            delete(Follow).where(
-                and_(Follow.follower_id == follower_id, Follow.following_id == following_id)
-            )
-        )
+    if removed is not None:
         await db_session.commit()
-        await hooks.do_action(AFTER_USER_UNFOLLOW, follower_id, following_id)
+        hooks.do_action_background(AFTER_USER_UNFOLLOW, follower_id, following_id)
         return False
-    else:
-        db_session.add(Follow(follower_id=follower_id, following_id=following_id))
-        await db_session.commit()
-        await hooks.do_action(AFTER_USER_FOLLOW, follower_id, following_id)
+
+    inserted = await insert_ignoring_duplicates(
+        db_session,
+        Follow,
+        ["follower_id", "following_id"],
+        follower_id=follower_id,
+        following_id=following_id,
+    )
+    await db_session.commit()
+    if not inserted:
+        # A concurrent request followed first and has already fired the hook
         return True
 
+    hooks.do_action_background(AFTER_USER_FOLLOW, follower_id, following_id)
+    return True
+
 
 async def is_following(db_session: AsyncSession, follower_id: UUID, following_id: UUID) -> bool:
-    result = await db_session.execute(
-        select(Follow).where(
+    return bool(await db_session.scalar(
+        select(exists().where(
             and_(Follow.follower_id == follower_id, Follow.following_id == following_id)
-        )
+        ))
+    ))
+
+
+async def get_profile_stats(
+    db_session: AsyncSession, user_id: UUID, viewer_id: UUID | None = None
+) -> ProfileStats:
+    """Fetch a profile's tweet/follower/following counts in one round trip.
+
+    Each count is a scalar subquery of a single ``SELECT``; the viewer's
+    follow state rides along as an ``EXISTS`` (False for anonymous or
+    self views).
+    """
+    tweet_count = (
+        select(func.count()).select_from(Tweet).where(
+            Tweet.user_id == user_id,
+            Tweet.is_deleted == False,
+            Tweet.parent_id.is_(None),
+        ).scalar_subquery()
     )
-    return result.scalar_one_or_none() is not None
-
-
-async def get_following_ids(db_session: AsyncSession, user_id: UUID) -> set[UUID]:
-    result = await db_session.execute(
-        select(Follow.following_id).where(Follow.follower_id == user_id)
+    follower_count = (
+        select(func.count()).select_from(Follow)
+        .where(Follow.following_id == user_id).scalar_subquery()
     )
-    return set(result.scalars().all())
-
-
-async def get_follower_count(db_session: AsyncSession, user_id: UUID) -> int:
-    result = await db_session.execute(
-        select(func.count()).select_from(Follow).where(Follow.following_id == user_id)
+    following_count = (
+        select(func.count()).select_from(Follow)
+        .where(Follow.follower_id == user_id).scalar_subquery()
     )
-    return result.scalar() or 0
-
+    if viewer_id is not None and viewer_id != user_id:
+        viewer_follows = exists().where(
+            and_(Follow.follower_id == viewer_id, Follow.following_id == user_id)
+        )
+    else:
+        viewer_follows = false()
 
-async def get_following_count(db_session: AsyncSession, user_id: UUID) -> int:
     result = await db_session.execute(
-        select(func.count()).select_from(Follow).where(Follow.follower_id == user_id)
+        select(tweet_count, follower_count, following_count, viewer_follows)
     )
-    return result.scalar() or 0
+    tweets, followers, following, follows = result.one()
+    return ProfileStats(tweets or 0, followers or 0, following or 0, bool(follows))
 
 
+# Follower and following lists only render each user's name, avatar and
+# email. ``User.roles`` is selectin-loaded by default, which would add a
+# roles query per page for data the list never shows.
 async def get_followers(
     db_session: AsyncSession,
     user_id: UUID,
@@ -75,13 +113,14 @@ async def get_followers(
 ) -> list[User]:
     result = await db_session.execute(
         select(User)
+        .options(lazyload(User.roles))
         .join(Follow, Follow.follower_id == User.id)
         .where(Follow.following_id == user_id)
         .order_by(Follow.created_at.desc())
         .offset(offset)
         .limit(limit)
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def get_following(
@@ -92,10 +131,11 @@ async def get_following(
 ) -> list[User]:
     result = await db_session.execute(
         select(User)
+        .options(lazyload(User.roles))
         .join(Follow, Follow.following_id == User.id)
         .where(Follow.follower_id == user_id)
         .order_by(Follow.created_at.desc())
         .offset(offset)
         .limit(limit)
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
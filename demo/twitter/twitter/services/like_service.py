@@ -1,55 +1,53 @@
 from uuid import UUID
 
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, delete, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from skrift.hooks import hooks
 from twitter.hooks import AFTER_TWEET_LIKE, AFTER_TWEET_UNLIKE
 from twitter.models.like import Like
 from twitter.models.tweet import Tweet
+from twitter.services.tweet_service import adjust_counter, insert_ignoring_duplicates
 
 
 async def toggle_like(db_session: AsyncSession, user_id: UUID, tweet_id: UUID) -> bool:
-    """Toggle like on a tweet. Returns True if liked, False if unliked."""
-    existing = await db_session.execute(
-        select(Like).where(and_(Like.user_id == user_id, Like.tweet_id == tweet_id))
+    """Toggle like on a tweet. Returns True if liked, False if unliked.
+
+    The counter is adjusted with an ``UPDATE`` in SQL rather than by loading
+    the tweet, so a like or unlike never reads the ``tweets`` row.
+    """
+    removed = await db_session.scalar(
+        delete(Like)
+        .where(and_(Like.user_id == user_id, Like.tweet_id == tweet_id))
+        .returning(Like.id)
     )
-    like = existing.scalar_one_or_none()
-
-    tweet = await db_session.execute(select(Tweet).where(Tweet.id == tweet_id))
-    tweet_obj = tweet.scalar_one_or_none()
-    if not tweet_obj:
+    if removed is not None:
+        await adjust_counter(db_session, Tweet.like_count, -1, Tweet.id == tweet_id)
+        await db_session.commit()
+        hooks.do_action_background(AFTER_TWEET_UNLIKE, user_id, tweet_id)
         return False
 
-    if like:
-        await db_session.execute(
-            delete(Like).where(and_(Like.user_id == user_id, Like.tweet_id == tweet_id))
-        )
-        tweet_obj.like_count = max(0, tweet_obj.like_count - 1)
-        await db_session.commit()
-        await hooks.do_action(AFTER_TWEET_UNLIKE, user_id, tweet_id)
+    # Bumping the counter first doubles as the existence check
+    if await adjust_counter(db_session, Tweet.like_count, 1, Tweet.id == tweet_id) is None:
         return False
-    else:
-        db_session.add(Like(user_id=user_id, tweet_id=tweet_id))
-        tweet_obj.like_count += 1
+
+    if not await insert_ignoring_duplicates(
+        db_session, Like, ["user_id", "tweet_id"], user_id=user_id, tweet_id=tweet_id
+    ):
+        # A concurrent request liked it first and already counted it. Undo
+        # our bump rather than rolling back, which would expire everything
+        # the request has loaded into the session.
+        await adjust_counter(db_session, Tweet.like_count, -1, Tweet.id == tweet_id)
         await db_session.commit()
-        await hooks.do_action(AFTER_TWEET_LIKE, user_id, tweet_id)
         return True
 
+    await db_session.commit()
+    hooks.do_action_background(AFTER_TWEET_LIKE, user_id, tweet_id)
+    return True
 
-async def has_user_liked(db_session: AsyncSession, user_id: UUID, tweet_id: UUID) -> bool:
-    result = await db_session.execute(
-        select(Like).where(and_(Like.user_id == user_id, Like.tweet_id == tweet_id))
-    )
-    return result.scalar_one_or_none() is not None
 
+async def has_user_liked(db_session: AsyncSession, user_id: UUID, tweet_id: UUID) -> bool:
+    return bool(await db_session.scalar(
+        select(exists().where(and_(Like.user_id == user_id, Like.tweet_id == tweet_id)))
+    ))
 
-async def get_liked_tweet_ids(db_session: AsyncSession, user_id: UUID, tweet_ids: list[UUID]) -> set[UUID]:
-    if not tweet_ids:
-        return set()
-    result = await db_session.execute(
-        select(Like.tweet_id).where(
-            and_(Like.user_id == user_id, Like.tweet_id.in_(tweet_ids))
-        )
-    )
-    return set(result.scalars().all())
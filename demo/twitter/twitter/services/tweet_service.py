@@ -1,11 +1,16 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
 from uuid import UUID
 
 from markupsafe import Markup
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, case, column, exists, func, literal_column, or_, table, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from skrift.hooks import hooks
+from skrift.db.models.user import User
+from skrift.hooks import action, hooks
 from twitter.hooks import (
     BEFORE_TWEET_SAVE, AFTER_TWEET_SAVE,
     BEFORE_TWEET_DELETE, AFTER_TWEET_DELETE,
@@ -13,6 +18,93 @@ from twitter.hooks import (
 )
 from twitter.models.tweet import Tweet
 
+MAX_RENDER_CACHE_ENTRIES = 10_000
+_render_cache: OrderedDict[str, Markup] = OrderedDict()
+# Filter chain the cached renders were produced with
+_render_cache_filters: tuple = ()
+
+# FTS5 table kept in sync with tweets by triggers on SQLite (migration
+# d2a9b7e4f6c1), keyed by the rowid tweets_fts_rowids assigns each tweet
+_tweets_fts = table("tweets_fts", column("rowid"), column("rank"))
+_tweets_fts_rowids = table("tweets_fts_rowids", column("rowid"), column("tweet_id"))
+
+
+async def adjust_counter(
+    db_session: AsyncSession, counter, delta: int, *criteria
+) -> UUID | None:
+    """Add ``delta`` to a tweet counter column in SQL, never going below zero.
+
+    Runs a single ``UPDATE`` over the tweets matching ``criteria`` instead of
+    loading and bumping them, so concurrent writers can't lose updates.
+    Returns the id of the updated tweet, or None if nothing matched.
+    """
+    value = counter + delta if delta > 0 else case((counter > -delta, counter + delta), else_=0)
+    return await db_session.scalar(
+        update(Tweet)
+        .where(*criteria)
+        .values({counter: value})
+        .returning(Tweet.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def insert_ignoring_duplicates(
+    db_session: AsyncSession, model: type, conflict_columns: list[str], **values
+) -> bool:
+    """Insert a row unless one with the same ``conflict_columns`` exists.
+
+    Uses ``ON CONFLICT DO NOTHING`` on PostgreSQL and SQLite so concurrent
+    toggles can't race into an IntegrityError; other dialects fall back to
+    a plain ORM add. Returns whether a row was inserted.
+    """
+    dialect_name = db_session.bind.dialect.name if db_session.bind is not None else ""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        db_session.add(model(**values))
+        return True
+
+    inserted = await db_session.scalar(
+        insert(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=conflict_columns)
+        .returning(model.id)
+    )
+    return inserted is not None
+
+
+# Eager-load the author and retweeted tweet (with its author) in batches.
+# Templates render ``tweet.user`` and ``tweet.retweet_of.user`` for every
+# row; loading them via ``SELECT ... IN`` keeps a list render at a fixed
+# number of queries regardless of length. Authors' roles (selectin by
+# default on ``User``) are never shown on a tweet, so they're skipped.
+# Loader options are immutable, so one tuple serves every query.
+TWEET_LOAD_OPTIONS = (
+    selectinload(Tweet.user).lazyload(User.roles),
+    selectinload(Tweet.retweet_of).selectinload(Tweet.user).lazyload(User.roles),
+)
+
+
+async def _load_relations(
+    db_session: AsyncSession,
+    tweet: Tweet,
+    parent: Tweet | None = None,
+    retweet_of: Tweet | None = None,
+) -> None:
+    """Make a new tweet's relationships readable after commit without re-selecting it.
+
+    Sessions don't expire on commit and every column has a client-side
+    default, so a new tweet is already current once committed; only its
+    relationships need filling in, since lazy loads can't run on an
+    ``AsyncSession``. Its author is normally in the identity map from the
+    request's ``get_current_user``, in which case ``get`` costs no query.
+    """
+    set_committed_value(tweet, "user", await db_session.get(User, tweet.user_id))
+    set_committed_value(tweet, "parent", parent)
+    set_committed_value(tweet, "retweet_of", retweet_of)
+
 
 async def create_tweet(
     db_session: AsyncSession,
@@ -30,14 +122,14 @@ async def create_tweet(
 
     db_session.add(tweet)
 
-    # Increment parent reply count
     if parent_id:
-        parent = await get_tweet_by_id(db_session, parent_id)
-        if parent:
-            parent.reply_count += 1
+        await adjust_counter(
+            db_session, Tweet.reply_count, 1, Tweet.id == parent_id, Tweet.is_deleted == False
+        )
 
     await db_session.commit()
-    await db_session.refresh(tweet)
+    parent = await db_session.get(Tweet, parent_id) if parent_id else None
+    await _load_relations(db_session, tweet, parent=parent)
 
     await hooks.do_action(AFTER_TWEET_SAVE, tweet, is_new=True)
     return tweet
@@ -53,16 +145,18 @@ async def create_retweet(
         return None
 
     # Check if already retweeted
-    existing = await db_session.execute(
-        select(Tweet).where(
-            and_(
-                Tweet.user_id == user_id,
-                Tweet.retweet_of_id == retweet_of_id,
-                Tweet.is_deleted == False,
+    already_retweeted = await db_session.scalar(
+        select(
+            exists().where(
+                and_(
+                    Tweet.user_id == user_id,
+                    Tweet.retweet_of_id == retweet_of_id,
+                    Tweet.is_deleted == False,
+                )
             )
         )
     )
-    if existing.scalar_one_or_none():
+    if already_retweeted:
         return None
 
     tweet = Tweet(
@@ -74,62 +168,62 @@ async def create_retweet(
     await hooks.do_action(BEFORE_TWEET_SAVE, tweet, is_new=True)
 
     db_session.add(tweet)
-    original.retweet_count += 1
+    await adjust_counter(db_session, Tweet.retweet_count, 1, Tweet.id == retweet_of_id)
+    # The UPDATE skips the session, so bring the loaded original up to date
+    # for AFTER_TWEET_SAVE handlers and the caller
+    set_committed_value(original, "retweet_count", original.retweet_count + 1)
 
     await db_session.commit()
-    await db_session.refresh(tweet)
+    await _load_relations(db_session, tweet, retweet_of=original)
 
     await hooks.do_action(AFTER_TWEET_SAVE, tweet, is_new=True)
     return tweet
 
 
-async def get_tweet_by_id(db_session: AsyncSession, tweet_id: UUID) -> Tweet | None:
-    result = await db_session.execute(
-        select(Tweet)
-        .options(selectinload(Tweet.retweet_of).selectinload(Tweet.user))
-        .where(and_(Tweet.id == tweet_id, Tweet.is_deleted == False))
+# Order for newest-first tweet lists; ``id`` breaks ties between tweets
+# created in the same instant so the ``created_before`` cursor is total.
+NEWEST_FIRST = (Tweet.created_at.desc(), Tweet.id.desc())
+
+
+def created_before(before: tuple[datetime, UUID] | None) -> tuple:
+    """Keyset page criteria for lists ordered by ``NEWEST_FIRST``.
+
+    Callers pass the ``(created_at, id)`` of the last tweet they showed.
+    Unlike an offset, the next page starts with a seek in the ``created_at``
+    indexes rather than by reading and discarding every earlier row.
+    """
+    if before is None:
+        return ()
+    created_at, tweet_id = before
+    return (
+        or_(
+            Tweet.created_at < created_at,
+            and_(Tweet.created_at == created_at, Tweet.id < tweet_id),
+        ),
     )
-    return result.scalar_one_or_none()
 
 
-async def get_tweet_replies(
-    db_session: AsyncSession,
-    tweet_id: UUID,
-    limit: int = 50,
-    offset: int = 0,
-) -> list[Tweet]:
+async def get_tweet_by_id(db_session: AsyncSession, tweet_id: UUID) -> Tweet | None:
     result = await db_session.execute(
         select(Tweet)
-        .options(selectinload(Tweet.retweet_of).selectinload(Tweet.user))
-        .where(and_(Tweet.parent_id == tweet_id, Tweet.is_deleted == False))
-        .order_by(Tweet.created_at.asc())
-        .offset(offset)
-        .limit(limit)
+        .options(*TWEET_LOAD_OPTIONS)
+        .where(and_(Tweet.id == tweet_id, Tweet.is_deleted == False))
     )
-    return list(result.scalars().all())
+    return result.scalar_one_or_none()
 
 
-async def get_user_tweets(
-    db_session: AsyncSession,
-    user_id: UUID,
-    limit: int = 50,
-    offset: int = 0,
-) -> list[Tweet]:
-    result = await db_session.execute(
-        select(Tweet)
-        .options(selectinload(Tweet.retweet_of).selectinload(Tweet.user))
-        .where(
-            and_(
-                Tweet.user_id == user_id,
-                Tweet.is_deleted == False,
-                Tweet.parent_id.is_(None),
+async def get_tweet_preview(
+    db_session: AsyncSession, tweet_id: UUID
+) -> tuple[UUID, str] | None:
+    """Return a live tweet's author id and content without loading the tweet."""
+    row = (
+        await db_session.execute(
+            select(Tweet.user_id, Tweet.content).where(
+                and_(Tweet.id == tweet_id, Tweet.is_deleted == False)
             )
         )
-        .order_by(Tweet.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-    )
-    return list(result.scalars().all())
+    ).first()
+    return tuple(row) if row else None
 
 
 async def soft_delete_tweet(db_session: AsyncSession, tweet_id: UUID) -> bool:
@@ -141,17 +235,23 @@ async def soft_delete_tweet(db_session: AsyncSession, tweet_id: UUID) -> bool:
 
     tweet.is_deleted = True
 
-    # Decrement parent reply count
     if tweet.parent_id:
-        parent = await get_tweet_by_id(db_session, tweet.parent_id)
-        if parent:
-            parent.reply_count = max(0, parent.reply_count - 1)
+        await adjust_counter(
+            db_session,
+            Tweet.reply_count,
+            -1,
+            Tweet.id == tweet.parent_id,
+            Tweet.is_deleted == False,
+        )
 
-    # Decrement original retweet count
     if tweet.retweet_of_id:
-        original = await get_tweet_by_id(db_session, tweet.retweet_of_id)
-        if original:
-            original.retweet_count = max(0, original.retweet_count - 1)
+        await adjust_counter(
+            db_session,
+            Tweet.retweet_count,
+            -1,
+            Tweet.id == tweet.retweet_of_id,
+            Tweet.is_deleted == False,
+        )
 
     await db_session.commit()
 
@@ -162,10 +262,10 @@ async def soft_delete_tweet(db_session: AsyncSession, tweet_id: UUID) -> bool:
 async def check_tweet_ownership(
     db_session: AsyncSession, tweet_id: UUID, user_id: UUID
 ) -> bool:
-    tweet = await get_tweet_by_id(db_session, tweet_id)
-    if not tweet:
-        return False
-    return tweet.user_id == user_id
+    owner_id = await db_session.scalar(
+        select(Tweet.user_id).where(and_(Tweet.id == tweet_id, Tweet.is_deleted == False))
+    )
+    return owner_id == user_id
 
 
 async def search_tweets(
@@ -174,25 +274,122 @@ async def search_tweets(
     limit: int = 50,
     offset: int = 0,
 ) -> list[Tweet]:
+    """Search live top-level tweets.
+
+    On PostgreSQL this is a full-text match served by the
+    ``ix_tweets_content_search`` GIN index, and on SQLite a match against
+    the ``tweets_fts`` FTS5 table, best matches first in both. Other
+    databases fall back to a newest-first substring scan.
+    """
+    statement = select(Tweet).options(*TWEET_LOAD_OPTIONS)
+    dialect_name = db_session.bind.dialect.name if db_session.bind is not None else ""
+    if dialect_name == "postgresql":
+        # Spelled exactly as in the index so the planner can use it.
+        document = func.to_tsvector(literal_column("'english'::regconfig"), Tweet.content)
+        ts_query = func.websearch_to_tsquery(literal_column("'english'::regconfig"), query)
+        match = document.op("@@")(ts_query)
+        order_by = (func.ts_rank(document, ts_query).desc(), Tweet.created_at.desc())
+    elif dialect_name == "sqlite":
+        terms = _fts5_terms(query)
+        if not terms:
+            return []
+        statement = statement.join(
+            _tweets_fts_rowids, _tweets_fts_rowids.c.tweet_id == Tweet.id
+        ).join(_tweets_fts, _tweets_fts.c.rowid == _tweets_fts_rowids.c.rowid)
+        match = literal_column("tweets_fts").op("MATCH")(terms)
+        order_by = (_tweets_fts.c.rank, Tweet.created_at.desc())
+    else:
+        match = Tweet.content.ilike(f"%{query}%")
+        order_by = (Tweet.created_at.desc(),)
+
     result = await db_session.execute(
-        select(Tweet)
-        .options(selectinload(Tweet.retweet_of).selectinload(Tweet.user))
+        statement
         .where(
             and_(
-                Tweet.content.ilike(f"%{query}%"),
+                match,
                 Tweet.is_deleted == False,
                 Tweet.parent_id.is_(None),
             )
         )
-        .order_by(Tweet.created_at.desc())
+        .order_by(*order_by)
         .offset(offset)
         .limit(limit)
     )
-    return list(result.scalars().all())
+    return result.scalars().all()
+
+
+def _fts5_terms(query: str) -> str:
+    """Quote each word of a search as an FTS5 string, ANDing them together.
+
+    Quoting keeps user input from being parsed as FTS5 query syntax.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+def _check_render_filters() -> None:
+    """Drop memoized renders if the content render filters have changed.
+
+    Plugins may register filters after the first render; output cached
+    under the old chain would otherwise be served indefinitely.
+    """
+    global _render_cache_filters
+    current = hooks.get_filters(TWEET_CONTENT_RENDER)
+    if current != _render_cache_filters:
+        _render_cache.clear()
+        _render_cache_filters = current
 
 
 async def render_tweet_content(content: str) -> Markup:
+    """Escape tweet text and run it through the content render filters.
+
+    Results are memoized by content: tweet text never changes after
+    creation, so the same text (hot feed entries, retweets of one source)
+    renders once per process for a given filter chain. Bounded LRU so
+    unique content can't grow it without limit.
+    """
+    _check_render_filters()
+    cached = _render_cache.get(content)
+    if cached is not None:
+        _render_cache.move_to_end(content)
+        return cached
+
     from html import escape
     safe_content = escape(content)
-    rendered = await hooks.apply_filters(TWEET_CONTENT_RENDER, safe_content)
-    return Markup(rendered)
+    rendered = Markup(await hooks.apply_filters(TWEET_CONTENT_RENDER, safe_content))
+
+    _render_cache[content] = rendered
+    if len(_render_cache) > MAX_RENDER_CACHE_ENTRIES:
+        _render_cache.popitem(last=False)
+    return rendered
+
+
+async def render_tweet_contents(contents: list[str]) -> list[Markup]:
+    """Render many tweet bodies, returning results in input order.
+
+    Repeated text is rendered once and cache hits are answered inline; only
+    the distinct misses are awaited, concurrently, so async render filters
+    that do I/O don't serialize across a page of tweets.
+    """
+    _check_render_filters()
+    rendered: dict[str, Markup] = {}
+    misses: list[str] = []
+    for content in dict.fromkeys(contents):
+        cached = _render_cache.get(content)
+        if cached is None:
+            misses.append(content)
+        else:
+            rendered[content] = cached
+    if misses:
+        results = await asyncio.gather(*(render_tweet_content(c) for c in misses))
+        rendered.update(zip(misses, results))
+    return [rendered[c] for c in contents]
+
+
+@action(AFTER_TWEET_SAVE)
+async def prerender_tweet_content(tweet: Tweet, **kwargs) -> None:
+    """Render a new tweet's content while it's being saved.
+
+    Its first viewers then hit the render cache instead of paying for the
+    render on the read path.
+    """
+    await render_tweet_content(tweet.content)
@@ -36,6 +36,7 @@ from skrift.hooks import (
     add_filter,
     apply_filters,
     do_action,
+    do_action_background,
     hooks,
 )
 from skrift.markdown import render_markdown
@@ -140,6 +141,7 @@ __all__ = [
     "configure_workers",
     "content_area",
     "do_action",
+    "do_action_background",
     "enqueue_webhook",
     "enqueue_webhook_standalone",
     "ensure_nid",
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from skrift.auth.services import get_user_permissions
 from skrift.auth.session_keys import SESSION_USER_ID
 from skrift.admin.navigation import build_admin_nav
+from skrift.controllers.helpers import parse_uuid
 from skrift.db.cache import get_by_pk
 from skrift.db.models.user import User
 from skrift.db.services import page_service
@@ -37,6 +38,10 @@ class PageFormData:
     featured_asset_id: str | None
 
 
+# SEO fields submitted blank are stored as NULL
+_OPTIONAL_SEO_FIELDS = ("meta_description", "og_title", "og_description", "og_image", "meta_robots")
+
+
 def extract_page_form_data(data: dict) -> PageFormData:
     """Extract and validate page form data from a form submission dict.
 
@@ -76,13 +81,9 @@ def extract_page_form_data(data: dict) -> PageFormData:
         is_published=is_published,
         order=order,
         publish_at=publish_at,
-        meta_description=data.get("meta_description", "").strip() or None,
-        og_title=data.get("og_title", "").strip() or None,
-        og_description=data.get("og_description", "").strip() or None,
-        og_image=data.get("og_image", "").strip() or None,
-        meta_robots=data.get("meta_robots", "").strip() or None,
         asset_ids=asset_ids,
         featured_asset_id=featured_asset_id,
+        **{field: data.get(field, "").strip() or None for field in _OPTIONAL_SEO_FIELDS},
     )
 
 
@@ -92,7 +93,7 @@ async def get_admin_context(request: Request, db_session: AsyncSession) -> dict:
     if not user_id:
         raise NotAuthorizedException("Authentication required")
 
-    user = await get_by_pk(db_session, User, UUID(user_id))
+    user = await get_by_pk(db_session, User, parse_uuid(user_id))
     if not user:
         raise NotAuthorizedException("Invalid user session")
 
@@ -144,7 +145,7 @@ async def check_page_access(
 
     # Check ownership for users with only the 'own' permission
     if own_permission in permissions.permissions:
-        if page.user_id == UUID(user_id):
+        if page.user_id == parse_uuid(user_id):
             return
 
     raise NotAuthorizedException("You don't have permission to access this page")
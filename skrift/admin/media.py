@@ -18,11 +18,13 @@ from skrift.admin.helpers import get_admin_context
 from skrift.auth.session_keys import SESSION_USER_ID
 from skrift.admin.navigation import ADMIN_NAV_TAG
 from skrift.auth.guards import Permission, auth_guard
+from skrift.controllers.helpers import parse_uuid
 from skrift.db.services.asset_service import (
     UploadTooLargeError,
     count_assets,
     delete_asset,
     get_asset_url,
+    get_asset_urls,
     list_assets,
     upload_asset,
 )
@@ -74,10 +76,9 @@ class MediaAdminController(Controller):
         total = await count_assets(db_session, store=store)
 
         storage: StorageManager = request.app.state.storage_manager
-        asset_urls = {
-            str(asset.id): await get_asset_url(storage, asset)
-            for asset in assets
-        }
+        asset_urls = dict(
+            zip((str(asset.id) for asset in assets), await get_asset_urls(storage, assets))
+        )
 
         total_pages = max(1, (total + per_page - 1) // per_page)
 
@@ -157,7 +158,7 @@ class MediaAdminController(Controller):
         """
         storage: StorageManager = request.app.state.storage_manager
         uid = request.session.get(SESSION_USER_ID)
-        user_id = UUID(uid) if uid else None
+        user_id = parse_uuid(uid) if uid else None
 
         filename = data.filename or "untitled"
         content_type = data.content_type or "application/octet-stream"
@@ -237,10 +238,9 @@ class MediaAdminController(Controller):
         total = await count_assets(db_session)
 
         storage: StorageManager = request.app.state.storage_manager
-        asset_urls = {
-            str(asset.id): await get_asset_url(storage, asset)
-            for asset in assets
-        }
+        asset_urls = dict(
+            zip((str(asset.id) for asset in assets), await get_asset_urls(storage, assets))
+        )
 
         total_pages = max(1, (total + per_page - 1) // per_page)
 
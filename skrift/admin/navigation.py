@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 
 ADMIN_NAV_TAG = "admin-nav"
 
+# app.state key for the route scan below; Litestar apps can't be weakly
+# referenced, so the cache lives on the app itself.
+_NAV_CANDIDATES_STATE_KEY = "_skrift_admin_nav_candidates"
+
 
 def admin_nav(label: str, *, icon: str = "circle", order: int = 100) -> dict:
     """Route kwargs that list a handler in the admin sidebar.
@@ -62,26 +66,20 @@ async def check_requirement(
         return await requirement.check(permissions)
 
 
-async def build_admin_nav(
-    app: "Litestar",
-    user_permissions: "UserPermissions",
-    current_path: str | None = None,
-) -> list[AdminNavItem]:
-    """Build admin navigation by introspecting routes.
+@dataclass(frozen=True, slots=True)
+class _NavCandidate:
+    """An admin-nav route and the guards that decide who sees it."""
 
-    Iterates through app routes to find handlers tagged with ADMIN_NAV_TAG,
-    extracts their permission guards, checks them against user permissions,
-    and returns accessible nav items sorted by order.
+    path: str
+    label: str
+    icon: str
+    order: int
+    requirements: tuple[AuthRequirement, ...]
 
-    Args:
-        app: The Litestar application instance
-        user_permissions: The current user's permissions
-        current_path: The current request path (for highlighting active nav)
 
-    Returns:
-        List of AdminNavItem for routes the user can access
-    """
-    nav_items: list[AdminNavItem] = []
+def _scan_nav_candidates(app: "Litestar") -> tuple[_NavCandidate, ...]:
+    """Collect every admin-nav tagged route, sorted by order then label."""
+    candidates: list[_NavCandidate] = []
 
     for route in app.routes:
         if not isinstance(route, HTTPRoute):
@@ -99,26 +97,74 @@ async def build_admin_nav(
 
             # Extract auth requirement guards
             guards = handler.guards or []
-            auth_requirements = [g for g in guards if isinstance(g, AuthRequirement)]
-
-            # Check all requirements
-            can_access = True
-            for requirement in auth_requirements:
-                if not await check_requirement(requirement, user_permissions):
-                    can_access = False
-                    break
-
-            if can_access:
-                nav_items.append(
-                    AdminNavItem(
-                        path=route.path,
-                        label=opt["label"],
-                        icon=opt.get("icon", "circle"),
-                        order=opt.get("order", 100),
-                    )
+            candidates.append(
+                _NavCandidate(
+                    path=route.path,
+                    label=opt["label"],
+                    icon=opt.get("icon", "circle"),
+                    order=opt.get("order", 100),
+                    requirements=tuple(g for g in guards if isinstance(g, AuthRequirement)),
                 )
+            )
+
+    candidates.sort(key=lambda c: (c.order, c.label))
+    return tuple(candidates)
+
+
+def _get_nav_candidates(app: "Litestar") -> tuple[_NavCandidate, ...]:
+    """Return the app's admin-nav routes, rescanning only when routes change.
+
+    The scan is keyed by the route count so handlers registered after
+    startup still show up.
+    """
+    route_count = len(app.routes)
+    cached = app.state.get(_NAV_CANDIDATES_STATE_KEY)
+    if cached is not None and cached[0] == route_count:
+        return cached[1]
 
-    # Sort by order, then by label
-    nav_items.sort(key=lambda x: (x.order, x.label))
+    candidates = _scan_nav_candidates(app)
+    app.state[_NAV_CANDIDATES_STATE_KEY] = (route_count, candidates)
+    return candidates
+
+
+async def build_admin_nav(
+    app: "Litestar",
+    user_permissions: "UserPermissions",
+    current_path: str | None = None,
+) -> list[AdminNavItem]:
+    """Build admin navigation by introspecting routes.
+
+    Iterates through app routes to find handlers tagged with ADMIN_NAV_TAG,
+    extracts their permission guards, checks them against user permissions,
+    and returns accessible nav items sorted by order.
+
+    Args:
+        app: The Litestar application instance
+        user_permissions: The current user's permissions
+        current_path: The current request path (for highlighting active nav)
+
+    Returns:
+        List of AdminNavItem for routes the user can access
+    """
+    nav_items: list[AdminNavItem] = []
+
+    # Route introspection is per app and cached; only the guard checks
+    # depend on the user, so they still run on every call.
+    for candidate in _get_nav_candidates(app):
+        can_access = True
+        for requirement in candidate.requirements:
+            if not await check_requirement(requirement, user_permissions):
+                can_access = False
+                break
+
+        if can_access:
+            nav_items.append(
+                AdminNavItem(
+                    path=candidate.path,
+                    label=candidate.label,
+                    icon=candidate.icon,
+                    order=candidate.order,
+                )
+            )
 
     return nav_items
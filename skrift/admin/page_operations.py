@@ -6,7 +6,7 @@ from collections.abc import Collection
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -31,6 +31,19 @@ def _get_permissions(permission_source: Collection[str] | object) -> Collection[
     return permissions
 
 
+def _admin_page_filters(
+    page_type_name: str,
+    user_id: UUID,
+    permissions: Collection[str] | object,
+    manage_permission: str,
+) -> list:
+    filters = [Page.type == page_type_name]
+    permission_values = _get_permissions(permissions)
+    if "administrator" not in permission_values and manage_permission not in permission_values:
+        filters.append(Page.user_id == user_id)
+    return filters
+
+
 async def list_pages_for_admin(
     db_session: AsyncSession,
     *,
@@ -38,21 +51,38 @@ async def list_pages_for_admin(
     user_id: UUID,
     permissions: Collection[str] | object,
     manage_permission: str,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[Page]:
     """List admin pages for the current user, applying ownership rules."""
     query = (
         select(Page)
-        .where(Page.type == page_type_name)
+        .where(*_admin_page_filters(page_type_name, user_id, permissions, manage_permission))
         .options(selectinload(Page.user))
-        .order_by(Page.order.asc(), Page.created_at.desc())
+        .order_by(Page.order.asc(), Page.created_at.desc(), Page.id)
+        .limit(limit)
+        .offset(offset)
     )
 
-    permission_values = _get_permissions(permissions)
-    if "administrator" not in permission_values and manage_permission not in permission_values:
-        query = query.where(Page.user_id == user_id)
-
     result = await db_session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
+
+
+async def count_pages_for_admin(
+    db_session: AsyncSession,
+    *,
+    page_type_name: str,
+    user_id: UUID,
+    permissions: Collection[str] | object,
+    manage_permission: str,
+) -> int:
+    """Count the pages ``list_pages_for_admin`` would list for the current user."""
+    result = await db_session.execute(
+        select(func.count())
+        .select_from(Page)
+        .where(*_admin_page_filters(page_type_name, user_id, permissions, manage_permission))
+    )
+    return result.scalar() or 0
 
 
 async def create_typed_page(
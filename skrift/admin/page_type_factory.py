@@ -19,6 +19,7 @@ from skrift.admin.helpers import (
     get_admin_context,
 )
 from skrift.admin.page_operations import (
+    count_pages_for_admin,
     create_typed_page,
     list_pages_for_admin,
     update_typed_page,
@@ -28,14 +29,17 @@ from skrift.admin.navigation import ADMIN_NAV_TAG
 from skrift.auth.guards import OwnerOrPermission, Permission, auth_guard
 from skrift.auth.roles import permissions_for_type
 from skrift.config import PageTypeConfig
+from skrift.controllers.helpers import parse_uuid
 from skrift.db.services import page_service, revision_service
-from skrift.db.services.asset_service import get_asset_url, image_url
+from skrift.db.services.asset_service import get_asset_urls, image_url
 from skrift.flash import flash_error, flash_success, get_flash_messages
 from skrift.hooks import PAGE_ADMIN_CAN_MUTATE, PAGE_ADMIN_PAGE_STATE, hooks
 from skrift.storage import StorageManager
 
 logger = logging.getLogger(__name__)
 
+PAGES_PER_ADMIN_LIST = 50
+
 
 def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
     """Create a Controller subclass for a specific page type.
@@ -105,16 +109,28 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
             opt={"label": label_plural, "icon": icon, "order": nav_order},
         )
         async def list_pages(
-            self, request: Request, db_session: AsyncSession
+            self, request: Request, db_session: AsyncSession, page: int = 1
         ) -> TemplateResponse:
             ctx = await get_admin_context(request, db_session)
+            page = max(page, 1)
+            list_filters = {
+                "page_type_name": type_name,
+                "user_id": parse_uuid(request.session[SESSION_USER_ID]),
+                "permissions": ctx["permissions"],
+                "manage_permission": perms["manage"],
+            }
             pages = await list_pages_for_admin(
                 db_session,
-                page_type_name=type_name,
-                user_id=UUID(request.session[SESSION_USER_ID]),
-                permissions=ctx["permissions"],
-                manage_permission=perms["manage"],
+                **list_filters,
+                limit=PAGES_PER_ADMIN_LIST,
+                offset=(page - 1) * PAGES_PER_ADMIN_LIST,
             )
+            # A short first page is the whole list; only count when it may not be
+            if page == 1 and len(pages) < PAGES_PER_ADMIN_LIST:
+                total = len(pages)
+            else:
+                total = await count_pages_for_admin(db_session, **list_filters)
+            total_pages = max(1, (total + PAGES_PER_ADMIN_LIST - 1) // PAGES_PER_ADMIN_LIST)
             page_states = await _page_admin_states(request, db_session, pages)
 
             flash_messages = get_flash_messages(request)
@@ -124,6 +140,9 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
                     "flash_messages": flash_messages,
                     "pages": pages,
                     "page_states": page_states,
+                    "page_number": page,
+                    "total_pages": total_pages,
+                    "total": total,
                     **page_type_ctx,
                     **ctx,
                 },
@@ -170,7 +189,7 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
                 flash_error(request, "Title and slug are required")
                 return Redirect(path=f"{admin_base}/new")
 
-            user_id = UUID(request.session[SESSION_USER_ID])
+            user_id = parse_uuid(request.session[SESSION_USER_ID])
 
             try:
                 await create_typed_page(
@@ -210,10 +229,12 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
 
             # Resolve asset URLs for attached assets
             storage: StorageManager = request.app.state.storage_manager
-            asset_urls = {
-                str(asset.id): await get_asset_url(storage, asset)
-                for asset in page.assets
-            }
+            asset_urls = dict(
+                zip(
+                    (str(asset.id) for asset in page.assets),
+                    await get_asset_urls(storage, page.assets),
+                )
+            )
             asset_image_urls = {
                 str(asset.id): await image_url(storage, asset, "thumb")
                 for asset in page.assets
@@ -270,7 +291,7 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
                     db_session,
                     page=page,
                     form=form,
-                    user_id=UUID(request.session[SESSION_USER_ID]),
+                    user_id=parse_uuid(request.session[SESSION_USER_ID]),
                     page_type_name=type_name,
                 )
                 flash_success(request, f"{label} '{form.title}' updated successfully!")
@@ -410,7 +431,7 @@ def create_page_type_controller(page_type: PageTypeConfig) -> type[Controller]:
 
             user_id = request.session.get(SESSION_USER_ID)
             await revision_service.restore_revision(
-                db_session, page, revision, UUID(user_id) if user_id else None
+                db_session, page, revision, parse_uuid(user_id) if user_id else None
             )
 
             flash_success(request, f"{label} restored to revision #{revision.revision_number}")
@@ -0,0 +1,39 @@
+"""Add composite indexes for the paginated admin page lists.
+
+The per-type admin lists filter on ``type`` (plus ``user_id`` for users who
+only manage their own pages) and sort by ``order``, then newest first, then
+``id`` to break ties; these indexes let a page of that list be read in index
+order without a sort.
+
+Revision ID: d4f5a6b7c8e9
+Revises: c3e4f5a6b7d8
+Create Date: 2026-08-01
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "d4f5a6b7c8e9"
+down_revision = "c3e4f5a6b7d8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_pages_type_order_created",
+        "pages",
+        ["type", "order", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_pages_user_type_order_created",
+        "pages",
+        ["user_id", "type", "order", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_pages_user_type_order_created", table_name="pages")
+    op.drop_index("ix_pages_type_order_created", table_name="pages")
@@ -5,30 +5,46 @@ Eliminates duplication between create_app() and create_setup_app() in asgi.py.
 
 from __future__ import annotations
 
+import binascii
+import copy
 import hashlib
 import logging
 import os
-from dataclasses import dataclass
+import time
+from base64 import b64decode
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 
+import jinja2
 from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.datastructures import MutableScopeHeaders
 from litestar.datastructures.cookie import Cookie
 from litestar.exceptions import HTTPException
 from litestar.middleware.session.client_side import (
+    AAD,
     ClientSideSessionBackend,
     CookieBackendConfig,
 )
+from litestar.middleware.session.server_side import (
+    ServerSideSessionBackend,
+    ServerSideSessionConfig,
+)
+from litestar.serialization import decode_json
 from litestar.template import TemplateConfig
+from litestar.types import Empty
 
+from skrift.auth.session_keys import SESSION_USER_ID
 from skrift.lib.exceptions import http_exception_handler, internal_server_error_handler
 from skrift.markdown import render_markdown
 from skrift.middleware.security import csp_nonce_var
 
 if TYPE_CHECKING:
+    from litestar import Litestar
     from litestar.connection import ASGIConnection
+    from litestar.stores.base import Store
     from litestar.types import Message, ScopeSession
 
 logger = logging.getLogger(__name__)
@@ -39,10 +55,18 @@ EXCEPTION_HANDLERS: dict[type[Exception], Any] = {
     Exception: internal_server_error_handler,
 }
 
+# Fixed for the life of the process; computed once rather than per app build.
+PACKAGE_TEMPLATE_DIR = Path(__file__).parent / "templates"
+
 # Module-level references for runtime updates
 _jinja_env = None
 
 
+# Scope key holding the session as loaded (plus its cookie expiry) so the
+# cookie backend can tell whether a response needs a fresh cookie.
+_SNAPSHOT_SCOPE_KEY = "_skrift_session_snapshot"
+
+
 class _SessionBackend(ClientSideSessionBackend):
     """Session backend that cleans up stale hostname-scoped session cookies.
 
@@ -58,14 +82,49 @@ class _SessionBackend(ClientSideSessionBackend):
     When ``cookie_domain`` is configured, every response that touches the
     session also emits a ``Set-Cookie`` *without* a ``Domain`` attribute
     (targeting the exact hostname), expiring any shadowing cookie.
+
+    Litestar re-encrypts a non-empty session on every response.  Requests
+    that leave the session unchanged (most page views) instead keep the
+    cookie the browser already has, unless it is past half its lifetime and
+    needs refreshing.  The re-encryption is always kept when
+    ``cookie_domain`` is set so the shadowing-cookie cleanup above can run.
     """
 
+    async def load_from_connection(self, connection: ASGIConnection) -> dict[str, Any]:
+        data = await super().load_from_connection(connection)
+        if data and not self.config.domain:
+            expires_at = self._cookie_expires_at(connection)
+            if expires_at is not None:
+                connection.scope[_SNAPSHOT_SCOPE_KEY] = (copy.deepcopy(data), expires_at)  # type: ignore[literal-required]
+        return data
+
+    def _cookie_expires_at(self, connection: ASGIConnection) -> int | None:
+        """Read ``expires_at`` from the (already verified) cookie's AAD."""
+        raw = "".join(connection.cookies[key] for key in self.get_cookie_keys(connection))
+        try:
+            decoded = b64decode(raw)
+        except (binascii.Error, ValueError):
+            return None
+        aad_starts_from = decoded.find(AAD)
+        if aad_starts_from == -1:
+            return None
+        return decode_json(decoded[aad_starts_from + len(AAD):])["expires_at"]
+
     async def store_in_message(
         self,
         scope_session: ScopeSession,
         message: Message,
         connection: ASGIConnection,
     ) -> None:
+        snapshot = connection.scope.get(_SNAPSHOT_SCOPE_KEY)
+        if (
+            snapshot is not None
+            and scope_session is not Empty
+            and scope_session == snapshot[0]
+            and snapshot[1] - time.time() > self.config.max_age / 2
+        ):
+            return
+
         await super().store_in_message(scope_session, message, connection)
 
         if not self.config.domain:
@@ -93,6 +152,12 @@ class _SessionConfig(CookieBackendConfig):
     _backend_class = _SessionBackend  # type: ignore[assignment]
 
 
+@lru_cache(maxsize=8)
+def _derive_session_secret(secret_key: str) -> bytes:
+    """Derive the 32-byte cookie encryption key once per distinct secret."""
+    return hashlib.sha256(secret_key.encode()).digest()
+
+
 def create_session_config(
     secret_key: str,
     max_age: int = 86400,
@@ -101,15 +166,118 @@ def create_session_config(
     cookie_name: str = "session",
 ) -> CookieBackendConfig:
     """Create a cookie-backed session config."""
-    session_secret = hashlib.sha256(secret_key.encode()).digest()
     return _SessionConfig(
-        secret=session_secret,
+        secret=_derive_session_secret(secret_key),
+        key=cookie_name,
+        max_age=max_age,
+        httponly=True,
+        secure=secure,
+        samesite="lax",
+        domain=cookie_domain,
+    )
+
+
+# Scope keys used by the server-side backend to detect a login/logout and
+# hand the rotated session ID from store_in_message to get_session_id.
+_LOADED_USER_SCOPE_KEY = "_skrift_session_loaded_user"
+_ROTATED_ID_SCOPE_KEY = "_skrift_session_rotated_id"
+
+
+class _ServerSideSessionBackend(ServerSideSessionBackend):
+    """Server-side session backend that rotates the session ID on login.
+
+    Empty sessions are never persisted, so anonymous traffic does not create
+    a store record (and a cookie) per request.
+
+    The cookie backend gets rotation for free because the whole session is
+    re-encrypted into a new cookie.  With an opaque session ID the ID would
+    otherwise survive authentication, so a pre-login ID planted by an attacker
+    would become an authenticated one.  Whenever the stored user changes, the
+    old record is deleted and the data is written under a fresh ID.
+    """
+
+    async def load_from_connection(self, connection: ASGIConnection) -> dict[str, Any]:
+        data = await super().load_from_connection(connection)
+        connection.scope[_LOADED_USER_SCOPE_KEY] = data.get(SESSION_USER_ID)  # type: ignore[literal-required]
+        return data
+
+    def get_session_id(self, connection: ASGIConnection) -> str:
+        rotated = connection.scope.get(_ROTATED_ID_SCOPE_KEY)
+        if rotated:
+            return rotated
+        return super().get_session_id(connection)
+
+    async def store_in_message(
+        self,
+        scope_session: ScopeSession,
+        message: Message,
+        connection: ASGIConnection,
+    ) -> None:
+        old_id = connection.cookies.get(self.config.key)
+        if old_id == "null":
+            old_id = None
+
+        # An empty session never reaches the store: anonymous requests write
+        # nothing, and a cleared session deletes its record and cookie.
+        if scope_session is Empty or not scope_session:
+            if old_id:
+                await super().store_in_message(Empty, message, connection)
+            return
+
+        if (
+            old_id
+            and scope_session.get(SESSION_USER_ID)
+            != connection.scope.get(_LOADED_USER_SCOPE_KEY)
+        ):
+            store = self.config.get_store_from_app(connection.scope["app"])
+            await self.delete(old_id, store=store)
+            connection.scope[_ROTATED_ID_SCOPE_KEY] = self.generate_session_id()  # type: ignore[literal-required]
+
+        await super().store_in_message(scope_session, message, connection)
+
+
+@dataclass
+class _RedisSessionConfig(ServerSideSessionConfig):
+    """Server-side session config bound directly to a Redis store.
+
+    Binding the store here rather than registering it on the app keeps the
+    config usable by every Litestar app that installs its middleware (the
+    main app and each per-site app) without threading ``stores=`` through.
+    """
+
+    _backend_class = _ServerSideSessionBackend  # type: ignore[assignment]
+
+    redis_store: Store | None = field(default=None)
+
+    def get_store_from_app(self, app: Litestar) -> Store:
+        if self.redis_store is not None:
+            return self.redis_store
+        return super().get_store_from_app(app)
+
+
+def create_redis_session_config(
+    redis_client: Any,
+    namespace: str,
+    max_age: int = 86400,
+    secure: bool = False,
+    cookie_domain: str | None = None,
+    cookie_name: str = "session",
+) -> ServerSideSessionConfig:
+    """Create a Redis-backed server-side session config.
+
+    The cookie carries only an opaque session ID, so requests skip the
+    per-request AES-GCM decrypt/encrypt of the cookie backend.
+    """
+    from litestar.stores.redis import RedisStore
+
+    return _RedisSessionConfig(
         key=cookie_name,
         max_age=max_age,
         httponly=True,
         secure=secure,
         samesite="lax",
         domain=cookie_domain,
+        redis_store=RedisStore(redis_client, namespace=namespace),
     )
 
 
@@ -128,7 +296,7 @@ def get_template_directories_for_theme(theme_name: str) -> list[Path]:
             dirs.append(theme_templates)
 
     dirs.append(Path(os.getcwd()) / "templates")
-    dirs.append(Path(__file__).parent / "templates")
+    dirs.append(PACKAGE_TEMPLATE_DIR)
     return dirs
 
 
@@ -154,11 +322,16 @@ def update_template_directories() -> None:
     if hasattr(_jinja_env, "cache") and _jinja_env.cache is not None:
         _jinja_env.cache.clear()
 
+    from skrift.template import Template
+
+    Template.clear_cache()
+
 
 def build_template_engine_callback(
     extra_globals: dict[str, Any],
     extra_filters: dict[str, Any] | None = None,
     register_for_updates: bool = True,
+    auto_reload: bool = True,
 ) -> Callable:
     """Build a template engine callback that sets globals and filters.
 
@@ -168,12 +341,27 @@ def build_template_engine_callback(
             its searchpath at runtime (e.g. after theme changes).  Set to False
             for subsidiary apps (subdomain sites) whose template directories
             are fixed at creation time.
+        auto_reload: When False (production), Jinja skips the per-render
+            source mtime check and keeps every compiled template for the life
+            of the process instead of in a 400-entry LRU.
     """
     def configure_engine(engine: JinjaTemplateEngine):
         if register_for_updates:
             global _jinja_env
             _jinja_env = engine.engine
 
+        # Persist compiled template bytecode across worker processes and
+        # restarts so only the first process after a template change pays
+        # the parse/compile cost. Entries are keyed by template source
+        # checksum, so the shared temp-dir cache never serves stale code.
+        engine.engine.bytecode_cache = jinja2.FileSystemBytecodeCache()
+
+        engine.engine.auto_reload = auto_reload
+        if not auto_reload:
+            # Equivalent to ``cache_size=-1``: an unbounded dict cache. Theme
+            # switches still flush it via update_template_directories().
+            engine.engine.cache = {}
+
         engine.engine.globals.update({
             "now": datetime.now,
             "csp_nonce": lambda: csp_nonce_var.get(""),
@@ -187,6 +375,27 @@ def build_template_engine_callback(
     return configure_engine
 
 
+def warm_template_cache(env: jinja2.Environment) -> int:
+    """Compile every ``.html`` template on the search path ahead of traffic.
+
+    Primes both Jinja's in-memory template cache and the bytecode cache so the
+    first request for each page doesn't pay the compile cost. Templates that
+    fail to compile are skipped; they'll raise normally when rendered.
+
+    Returns:
+        The number of templates compiled.
+    """
+    compiled = 0
+    for name in env.list_templates(extensions=["html"]):
+        try:
+            env.get_template(name)
+        except jinja2.TemplateError:
+            logger.debug("Skipping template %s during warm-up", name, exc_info=True)
+            continue
+        compiled += 1
+    return compiled
+
+
 def create_template_config(directories: list[Path], engine_callback: Callable) -> TemplateConfig:
     """Create template config using the given template directories."""
     return TemplateConfig(
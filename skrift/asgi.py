@@ -10,14 +10,16 @@ The application uses a dispatcher architecture:
 import asyncio
 import hashlib
 import importlib
+import json
 import logging
 import os
+import stat
 import sys
 from collections.abc import Callable
 from pathlib import Path
+from types import ModuleType
 from typing import Any
 
-import yaml
 from advanced_alchemy.config import EngineConfig
 from advanced_alchemy.extensions.litestar import (
     AsyncSessionConfig,
@@ -31,15 +33,18 @@ from litestar import Litestar
 from skrift.middleware.compression import build_compression_middleware
 from litestar.middleware import DefineMiddleware
 from litestar.types import ASGIApp, Receive, Scope, Send
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from skrift.app_factory import (
     EXCEPTION_HANDLERS,
     build_template_engine_callback,
+    create_redis_session_config,
     create_session_config,
     create_static_hasher,
     create_template_config,
     get_template_directories,
     update_template_directories,
+    warm_template_cache,
 )
 from skrift.config import (
     CompressionConfig,
@@ -51,6 +56,7 @@ from skrift.config import (
     resolve_request_max_body_size,
 )
 from skrift.db.services.asset_service import internal_asset_url
+from skrift.template import set_template_cache_enabled
 from skrift.ratelimit import RateLimiter, set_limiter
 from skrift.lib.trusted_proxy import TrustedProxyManager
 from skrift.middleware.client_ip import ClientIPMiddleware
@@ -75,6 +81,9 @@ from skrift.db.services.setting_service import (
 
 logger = logging.getLogger(__name__)
 
+# Fixed for the life of the process; computed once rather than per app build.
+PACKAGE_STATIC_DIR = Path(__file__).parent / "static"
+
 
 class ThemeStaticURL:
     """Resolves theme-relative static paths by prepending the active theme name.
@@ -133,6 +142,69 @@ class StaticHasher:
         return f"/static/{path}"
 
 
+def _app_yaml_cache_path(config_path: Path) -> Path:
+    """Return the JSON sidecar path used to cache a parsed config file."""
+    return config_path.with_name(f".{config_path.name}.cache.json")
+
+
+def _read_app_yaml(config_path: Path) -> Any:
+    """Parse app.yaml, reusing a JSON sidecar while the file is unchanged.
+
+    The sidecar is keyed on the YAML file's mtime and size. On a hit the
+    document is loaded with ``json.loads`` instead of PyYAML; on a miss the
+    YAML is parsed and the sidecar rewritten. Cache writes are best-effort so
+    read-only deployments simply fall back to parsing every time.
+    """
+    config_stat = config_path.stat()
+    fingerprint = [config_stat.st_mtime_ns, config_stat.st_size]
+    cache_path = _app_yaml_cache_path(config_path)
+
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached["fingerprint"] == fingerprint:
+            return cached["config"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    # Deferred so importing this module (CLI tooling, Alembic, tests) doesn't
+    # pay PyYAML's import cost; prefer the libyaml-backed loader when built.
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, "r") as f:
+        config = yaml.load(f, Loader=loader)
+
+    _write_app_yaml_cache(cache_path, fingerprint, config, stat.S_IMODE(config_stat.st_mode))
+    return config
+
+
+def _write_app_yaml_cache(
+    cache_path: Path, fingerprint: list[int], config: Any, mode: int
+) -> None:
+    """Atomically write the JSON sidecar for a parsed config document.
+
+    The sidecar is a plaintext copy of the config, so it is created with the
+    config file's ``mode`` rather than the umask default. Documents that don't survive a JSON round trip unchanged (dates, non-string
+    keys, ...) are never cached so a hit always matches a fresh YAML parse.
+    """
+    try:
+        payload = json.dumps({"fingerprint": fingerprint, "config": config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload)["config"] != config:
+        return
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "w") as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        logger.debug("Could not write config cache %s", cache_path, exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+
 def load_controllers() -> list:
     """Load controllers from app.yaml configuration."""
     config_path = get_config_path()
@@ -140,8 +212,7 @@ def load_controllers() -> list:
     if not config_path.exists():
         return []
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = _read_app_yaml(config_path)
 
     if not config:
         return []
@@ -153,9 +224,13 @@ def load_controllers() -> list:
 
     controllers = []
     seen: set[type] = set()
+    # Several specs often share a module; import each one only once.
+    modules: dict[str, ModuleType] = {}
     for controller_spec in config.get("controllers", []):
         module_path, class_name = controller_spec.split(":")
-        module = importlib.import_module(module_path)
+        module = modules.get(module_path)
+        if module is None:
+            module = modules[module_path] = importlib.import_module(module_path)
         controller_class = getattr(module, class_name)
         if controller_class in seen:
             raise ValueError(
@@ -232,9 +307,12 @@ def load_site_controllers(specs: list[str]) -> list:
 
     controllers = []
     seen: set[type] = set()
+    modules: dict[str, ModuleType] = {}
     for spec in specs:
         module_path, class_name = spec.split(":")
-        module = importlib.import_module(module_path)
+        module = modules.get(module_path)
+        if module is None:
+            module = modules[module_path] = importlib.import_module(module_path)
         controller_class = getattr(module, class_name)
         if controller_class in seen:
             raise ValueError(
@@ -306,8 +384,7 @@ def load_middleware() -> list:
     if not config_path.exists():
         return []
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    config = _read_app_yaml(config_path)
 
     if not config:
         return []
@@ -649,6 +726,7 @@ def _build_site_app(
         },
         extra_filters={"sized": _sized_url},
         register_for_updates=False,
+        auto_reload=settings.debug,
     )
     template_config = create_template_config(template_dirs, engine_callback)
 
@@ -735,6 +813,28 @@ def _build_database_engine_config(db: DatabaseConfig) -> EngineConfig:
     return EngineConfig(**engine_kwargs)
 
 
+async def _prewarm_database_pool(engine: AsyncEngine, size: int) -> None:
+    """Open ``size`` pooled connections at once, then return them to the pool.
+
+    The first requests after boot then check out a ready connection instead
+    of each paying for a connect and authentication handshake.
+    """
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    failures = [conn for conn in connections if isinstance(conn, BaseException)]
+    for conn in connections:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    if failures:
+        logger.info(
+            "Database pool prewarm opened %d of %d connections",
+            size - len(failures),
+            size,
+            exc_info=failures[0],
+        )
+
+
 def create_app() -> ASGIApp:
     """Create and configure the main Litestar application.
 
@@ -788,15 +888,6 @@ def create_app() -> ASGIApp:
         engine_config=engine_config,
     )
 
-    # Session configuration (client-side encrypted cookies)
-    session_config = create_session_config(
-        secret_key=settings.secret_key,
-        max_age=settings.session.max_age,
-        secure=not settings.debug,
-        cookie_domain=settings.session.cookie_domain,
-        cookie_name=settings.session.cookie_name,
-    )
-
     # Security headers middleware
     security_middleware = []
     if settings.security_headers.enabled:
@@ -831,6 +922,31 @@ def create_app() -> ASGIApp:
     set_limiter(rate_limiter)
     _redis_client = rate_limiter.redis_client
 
+    # Session configuration — encrypted cookies by default, or Redis-backed
+    # server-side sessions sharing the limiter's connection.
+    if settings.session.backend == "redis" and _redis_client is not None:
+        session_config = create_redis_session_config(
+            _redis_client,
+            namespace=settings.redis.make_key("skrift", "sessions"),
+            max_age=settings.session.max_age,
+            secure=not settings.debug,
+            cookie_domain=settings.session.cookie_domain,
+            cookie_name=settings.session.cookie_name,
+        )
+    else:
+        if settings.session.backend == "redis":
+            logger.warning(
+                "session.backend is 'redis' but no Redis client is available; "
+                "falling back to cookie sessions"
+            )
+        session_config = create_session_config(
+            secret_key=settings.secret_key,
+            max_age=settings.session.max_age,
+            secure=not settings.debug,
+            cookie_domain=settings.session.cookie_domain,
+            cookie_name=settings.session.cookie_name,
+        )
+
     # Rate limiting middleware
     rate_limit_middleware = []
     if settings.rate_limit.enabled:
@@ -877,7 +993,7 @@ def create_app() -> ASGIApp:
     from skrift.lib.theme import get_themes_dir
     themes_dir = get_themes_dir()
     site_static_dir = Path(os.getcwd()) / "static"
-    package_static_dir = Path(__file__).parent / "static"
+    package_static_dir = PACKAGE_STATIC_DIR
     static_url = create_static_hasher(
         themes_dir=themes_dir,
         site_static_dir=site_static_dir,
@@ -925,6 +1041,8 @@ def create_app() -> ASGIApp:
         return f"{url}{sep}size={size}"
 
     template_dirs = get_template_directories()
+    # Debug mode re-resolves templates on every request so new files show up.
+    set_template_cache_enabled(not settings.debug)
 
     template_globals = {
         "site_name": get_cached_site_name,
@@ -982,6 +1100,7 @@ def create_app() -> ASGIApp:
     engine_callback = build_template_engine_callback(
         extra_globals=template_globals,
         extra_filters={"sized": _sized_url},
+        auto_reload=settings.debug,
     )
     template_config = create_template_config(template_dirs, engine_callback)
 
@@ -1070,10 +1189,16 @@ def create_app() -> ASGIApp:
         except Exception:
             logger.info("Startup cache init skipped (DB may not exist)", exc_info=True)
 
+        if settings.db.pool_prewarm and "sqlite" not in settings.db.url:
+            await _prewarm_database_pool(db_config.get_engine(), settings.db.pool_size)
+
         await _resolve_favicon_url()
 
         update_template_directories()
 
+        if not settings.debug:
+            warm_template_cache(_app.template_engine.engine)
+
         observability.instrument_sqlalchemy(db_config.get_engine())
 
         from skrift.hooks import APP_STARTUP, LOGFIRE_CONFIGURED, hooks
@@ -1335,7 +1460,7 @@ def create_setup_app() -> Litestar:
     from skrift.lib.theme import get_themes_dir
     themes_dir = get_themes_dir()
     site_static_dir = Path(os.getcwd()) / "static"
-    package_static_dir = Path(__file__).parent / "static"
+    package_static_dir = PACKAGE_STATIC_DIR
     static_url = create_static_hasher(
         themes_dir=themes_dir,
         site_static_dir=site_static_dir,
@@ -1384,6 +1509,8 @@ def create_setup_app() -> Litestar:
         config_path = get_config_path()
         if config_path.exists():
             try:
+                import yaml
+
                 with open(config_path, "r") as f:
                     raw_config = yaml.safe_load(f)
                 raw_db_url = raw_config.get("db", {}).get("url", "")
@@ -8,6 +8,7 @@ from litestar.response import Template as TemplateResponse
 from skrift.auth.methods.base import PrimaryAuthMethod, PrimaryAuthMethodDescriptor
 from skrift.auth.session_keys import SESSION_AUTH_NEXT
 from skrift.config import get_settings
+from skrift.flash import pop_flash
 from skrift.lib.redirects import is_safe_redirect_url
 from skrift.template import resolve_template_name
 from skrift.setup.providers import DUMMY_PROVIDER_KEY
@@ -34,7 +35,7 @@ class DummyPrimaryAuthMethod(PrimaryAuthMethod):
         if next_url and is_safe_redirect_url(next_url, settings.auth.allowed_redirect_domains):
             request.session[SESSION_AUTH_NEXT] = next_url
 
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         template_name = resolve_template_name(
             request.app.template_engine, "dummy_login.html", "auth/dummy_login.html"
         )
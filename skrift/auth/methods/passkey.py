@@ -8,7 +8,7 @@ from skrift.auth.methods.base import PrimaryAuthMethod, PrimaryAuthMethodDescrip
 from skrift.auth.second_factors.passkey_service import is_webauthn_available
 from skrift.auth.session_keys import SESSION_AUTH_NEXT
 from skrift.config import get_settings
-from skrift.flash import get_flash_messages
+from skrift.flash import get_flash_messages, pop_flash
 from skrift.lib.redirects import is_safe_redirect_url
 from skrift.template import resolve_template_name
 
@@ -49,7 +49,7 @@ class PasskeyPrimaryAuthMethod(PrimaryAuthMethod):
             context={
                 "method_key": self.method_key,
                 "descriptor": self.get_descriptor(),
-                "flash": request.session.pop("flash", None),
+                "flash": pop_flash(request),
                 "flash_messages": get_flash_messages(request),
             },
         )
@@ -282,10 +282,7 @@ async def complete_verified_email_link(
     oauth_account = result.scalar_one_or_none()
 
     if oauth_account is None:
-        user_result = await db_session.execute(
-            select(User).where(User.id == existing_user_id)
-        )
-        user = user_result.scalar_one_or_none()
+        user = await db_session.get(User, existing_user_id)
         if user is None:
             raise ValueError("Target user for email-verified link not found")
         oauth_account = OAuthAccount(
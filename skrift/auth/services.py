@@ -65,7 +65,6 @@ async def get_user_permissions(
     ``MAX_PERMISSION_CACHE_ENTRIES`` and evicts least-recently-used entries.
     """
     user_id_str = str(user_id)
-    user_id_uuid = user_id if isinstance(user_id, UUID) else UUID(user_id)
 
     # Check cache
     if user_id_str in _permission_cache:
@@ -74,6 +73,9 @@ async def get_user_permissions(
             _permission_cache.move_to_end(user_id_str)
             return cached_perms
 
+    # Only parse the ID on a miss; cache hits are keyed by the raw string.
+    user_id_uuid = user_id if isinstance(user_id, UUID) else UUID(user_id)
+
     # Query user with roles and permissions
     from skrift.db.models.user import User
 
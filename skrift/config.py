@@ -5,7 +5,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
-import yaml
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, PrivateAttr, create_model, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -130,6 +129,8 @@ def load_app_config(interpolate: bool = True, strict: bool = True) -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"{config_path.name} not found at {config_path}")
 
+    import yaml
+
     with open(config_path, "r") as f:
         config = yaml.safe_load(f)
 
@@ -145,6 +146,8 @@ def load_raw_app_config() -> dict | None:
     if not config_path.exists():
         return None
 
+    import yaml
+
     with open(config_path, "r") as f:
         return yaml.safe_load(f)
 
@@ -292,6 +295,7 @@ class DatabaseConfig(BaseModel):
     pool_timeout: int = 30
     pool_pre_ping: bool = True  # Validate connections before use
     pool_recycle: int | None = None  # Seconds before recycling pooled connections
+    pool_prewarm: bool = True  # Open pool_size connections at startup
     echo: bool = False
     db_schema: str | None = Field(default=None, validation_alias="schema")
     statement_cache_size: int | None = None  # asyncpg statement cache size; 0 disables prepared statements
@@ -489,6 +493,10 @@ class SecurityHeadersConfig(BaseModel):
 class SessionConfig(BaseModel):
     """Session cookie configuration."""
 
+    # "cookie" keeps the whole session in an encrypted cookie. "redis" stores
+    # it server-side under an opaque cookie ID (requires ``redis.url``),
+    # avoiding the per-request AES-GCM round trip.
+    backend: Literal["cookie", "redis"] = "cookie"
     cookie_name: str = "session"
     cookie_domain: str | None = None  # None = exact host only
     max_age: int = 86400  # 1 day in seconds — hard cookie lifetime cap
@@ -73,16 +73,14 @@ from skrift.auth.session_service import (
     finalize_authenticated_session,
     get_pending_authentication,
 )
+from skrift.controllers.helpers import get_current_user, parse_uuid
 from skrift.db.models.user import User
-from skrift.auth.session_keys import (
-    SESSION_AUTH_NEXT,
-    SESSION_USER_ID,
-)
+from skrift.auth.session_keys import SESSION_AUTH_NEXT
 from jinja2.exceptions import TemplatesNotFound
 
 from skrift.forms import verify_csrf
 from skrift.forms.core import CSRF_SESSION_KEY
-from skrift.flash import flash_error, flash_success, get_flash_messages
+from skrift.flash import flash_error, flash_success, get_flash_messages, pop_flash
 from skrift.hooks import hooks
 from skrift.lib.redirects import get_safe_redirect_url, is_safe_redirect_url
 from skrift.template import resolve_template_name
@@ -126,12 +124,7 @@ async def _complete_pending_login(
 
 async def _get_authenticated_user(request: Request, db_session: AsyncSession) -> User | None:
     """Load the currently authenticated user from the session."""
-    user_id = request.session.get(SESSION_USER_ID)
-    if not user_id:
-        return None
-
-    result = await db_session.execute(select(User).where(User.id == UUID(str(user_id))))
-    return result.scalar_one_or_none()
+    return await get_current_user(request, db_session)
 
 
 def _csrf_error(request: Request, error: str, *, status_code: int = 400) -> Response:
@@ -448,7 +441,7 @@ class AuthController(Controller):
         next_url: Annotated[str | None, Parameter(query="next")] = None,
     ) -> TemplateResponse:
         """Show login page with available providers."""
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         flash_messages = get_flash_messages(request)
         settings = get_settings()
 
@@ -1034,10 +1027,7 @@ class AuthController(Controller):
         if not _is_passkey_factor(settings, factor_key):
             return Response(content={"error": "unsupported_factor"}, status_code=400)
 
-        result = await db_session.execute(
-            select(User).where(User.id == UUID(pending_auth.user_id))
-        )
-        user = result.scalar_one_or_none()
+        user = await db_session.get(User, parse_uuid(pending_auth.user_id))
         if user is None:
             logger.info(
                 "Second-factor options: pending-auth user not found (user_id=%s)",
@@ -1095,10 +1085,7 @@ class AuthController(Controller):
         if not _is_passkey_factor(settings, factor_key):
             return Response(content={"error": "unsupported_factor"}, status_code=400)
 
-        result = await db_session.execute(
-            select(User).where(User.id == UUID(pending_auth.user_id))
-        )
-        user = result.scalar_one_or_none()
+        user = await db_session.get(User, parse_uuid(pending_auth.user_id))
         if user is None:
             logger.info(
                 "Second-factor complete: pending-auth user not found (user_id=%s)",
@@ -1,5 +1,6 @@
 """Shared helpers for public-facing controllers."""
 
+from functools import lru_cache
 from uuid import UUID
 
 from litestar import Request
@@ -12,14 +13,31 @@ from skrift.db.services.setting_service import get_cached_site_theme
 from skrift.hooks import RESOLVE_THEME, apply_filters
 
 
-async def get_user_context(request: Request, db_session: AsyncSession) -> dict:
-    """Get user data for template context if logged in."""
+@lru_cache(maxsize=8192)
+def parse_uuid(value: str) -> UUID:
+    """Parse a UUID string, memoized since the same session IDs recur per request.
+
+    Invalid values raise ``ValueError`` exactly like ``UUID()`` and are not cached.
+    """
+    return UUID(value)
+
+
+async def get_current_user(request: Request, db_session: AsyncSession) -> User | None:
+    """Return the signed-in user, loaded at most once per request.
+
+    The lookup goes through the request-scoped primary-key cache, so
+    handlers and helpers that each ask for the user share one query.
+    """
     user_id = request.session.get(SESSION_USER_ID)
     if not user_id:
-        return {"user": None}
+        return None
+
+    return await get_by_pk(db_session, User, parse_uuid(user_id))
+
 
-    user = await get_by_pk(db_session, User, UUID(user_id))
-    return {"user": user}
+async def get_user_context(request: Request, db_session: AsyncSession) -> dict:
+    """Get user data for template context if logged in."""
+    return {"user": await get_current_user(request, db_session)}
 
 
 async def resolve_theme(request: Request) -> str:
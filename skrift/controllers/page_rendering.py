@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 
@@ -9,11 +10,12 @@ from litestar import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from skrift.controllers.helpers import get_user_context, resolve_theme
-from skrift.db.services.asset_service import get_asset_url, image_url, internal_asset_url
+from skrift.db.services.asset_service import get_asset_urls, image_url, internal_asset_url
 from skrift.db.services.setting_service import (
     get_cached_site_base_url,
     get_cached_site_name,
 )
+from skrift.flash import pop_flash
 from skrift.seo import get_page_og_meta, get_page_seo_meta
 from skrift.storage import StorageManager
 
@@ -47,7 +49,7 @@ async def build_public_page_render_context(
 ) -> PublicPageRenderContext:
     """Resolve shared page context used by public controllers."""
     user_ctx = await get_user_context(request, db_session)
-    flash = request.session.pop("flash", None)
+    flash = pop_flash(request)
     theme_name = await resolve_theme(request)
 
     asset_urls: dict[str, str] = {}
@@ -58,17 +60,23 @@ async def build_public_page_render_context(
 
     if include_asset_urls and page.assets:
         storage = request.app.state.storage_manager
-        asset_urls = {
-            str(asset.id): await get_asset_url(storage, asset)
-            for asset in page.assets
-        }
-        # Pre-resolve gallery thumbnails at the ``medium`` size. ``image_url``
-        # returns the backend's direct (CDN) URL once the variant exists, so warm
-        # requests skip Skrift; cold ones fall back to the lazy ``/storage`` URL.
+        image_assets = [
+            asset for asset in page.assets if asset.content_type.startswith("image/")
+        ]
+        # Backend URL lookups are independent network calls on remote stores,
+        # so resolve them concurrently. (DB work stays sequential: the
+        # request's AsyncSession doesn't allow concurrent operations.)
+        # Gallery thumbnails are pre-resolved at the ``medium`` size.
+        # ``image_url`` returns the backend's direct (CDN) URL once the variant
+        # exists, so warm requests skip Skrift; cold ones fall back to the lazy
+        # ``/storage`` URL.
+        urls, image_urls = await asyncio.gather(
+            get_asset_urls(storage, page.assets),
+            asyncio.gather(*(image_url(storage, asset, "medium") for asset in image_assets)),
+        )
+        asset_urls = {str(asset.id): url for asset, url in zip(page.assets, urls)}
         asset_image_urls = {
-            str(asset.id): await image_url(storage, asset, "medium")
-            for asset in page.assets
-            if asset.content_type.startswith("image/")
+            str(asset.id): url for asset, url in zip(image_assets, image_urls)
         }
 
     if page.featured_asset:
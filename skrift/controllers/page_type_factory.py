@@ -17,6 +17,7 @@ from skrift.controllers.page_rendering import (
     wants_markdown_response,
 )
 from skrift.db.services import page_service
+from skrift.flash import pop_flash
 from skrift.template import Template
 
 TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
@@ -52,7 +53,7 @@ def create_public_page_type_controller(
             self, request: Request, db_session: AsyncSession
         ) -> TemplateResponse:
             user_ctx = await get_user_context(request, db_session)
-            flash = request.session.pop("flash", None)
+            flash = pop_flash(request)
             theme_name = await resolve_theme(request)
 
             pages = await page_service.list_pages(
@@ -13,6 +13,7 @@ from skrift.controllers.page_rendering import (
     wants_markdown_response,
 )
 from skrift.db.services import content_service, page_service
+from skrift.flash import pop_flash
 from skrift.template import Template
 
 TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
@@ -27,7 +28,7 @@ class WebController(Controller):
     ) -> TemplateResponse:
         """Home page rendered from the admin-editable ``home`` content area."""
         user_ctx = await get_user_context(request, db_session)
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
 
         schema = get_content_area("home")
         saved = await content_service.get_content_data(db_session, "home")
@@ -47,8 +48,11 @@ class WebController(Controller):
         self, request: "Request", db_session: AsyncSession, path: str
     ) -> TemplateResponse | Response:
         """View a page by path with WP-like template resolution."""
-        # Split path into slugs (e.g., "services/web" -> ["services", "web"])
-        slugs = [s for s in path.split("/") if s]
+        # Split path into slugs (e.g., "services/web" -> ("services", "web"))
+        slugs = tuple(filter(None, path.split("/")))
+        if not slugs:
+            # Only separators (e.g. "//"): no page can match, skip the lookup.
+            raise NotFoundException(f"Page '{path}' not found")
 
         # Use the full path as the slug for database lookup
         page_slug = "/".join(slugs)
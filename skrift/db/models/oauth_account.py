@@ -44,8 +44,10 @@ class OAuthAccount(Base):
     )
     access_token: Mapped[str | None] = mapped_column(String(2048), nullable=True)
     refresh_token: Mapped[str | None] = mapped_column(String(2048), nullable=True)
+    # Indexed for the per-user account lookups (account page, provider
+    # linking); matches ix_oauth_accounts_user_id from the migration.
     user_id: Mapped[UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     user: Mapped["User"] = relationship("User", back_populates="oauth_accounts")
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Integer
+from sqlalchemy import String, Text, Boolean, DateTime, ForeignKey, Index, Integer, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from skrift.db.base import Base
@@ -19,6 +19,15 @@ class Page(Base):
     """Page model for content management."""
 
     __tablename__ = "pages"
+    __table_args__ = (
+        # Admin lists filter by type (and owner) and sort by order, newest
+        # first, then id to break ties
+        Index("ix_pages_type_order_created", "type", "order", text("created_at DESC"), "id"),
+        Index(
+            "ix_pages_user_type_order_created",
+            "user_id", "type", "order", text("created_at DESC"), "id",
+        ),
+    )
 
     # Author relationship (optional - pages may not have an author)
     user_id: Mapped[UUID | None] = mapped_column(ForeignKey("users.id"), nullable=True, index=True)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+from collections.abc import Sequence
 from uuid import UUID
 
 from sqlalchemy import and_, delete, func, select
@@ -140,6 +142,20 @@ async def get_asset_url(storage: StorageManager, asset: Asset) -> str:
     return await backend.get_url(asset.key)
 
 
+async def get_asset_urls(storage: StorageManager, assets: Sequence[Asset]) -> list[str]:
+    """Return public/signed URLs for *assets*, in order.
+
+    Each distinct store's backend is resolved once, then the per-asset URL
+    lookups run concurrently.
+    """
+    backends = {}
+    for store in dict.fromkeys(asset.store for asset in assets):
+        backends[store] = await storage.get(store)
+    return list(
+        await asyncio.gather(*(backends[asset.store].get_url(asset.key) for asset in assets))
+    )
+
+
 def internal_asset_url(store: str, key: str) -> str:
     """Return the Skrift-internal storage URL for a key.
 
@@ -1,5 +1,6 @@
 """Page service for CRUD operations on pages."""
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, UTC
 from typing import Literal
@@ -7,6 +8,7 @@ from uuid import UUID
 
 from sqlalchemy import select, and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
 from skrift.db.cache import evict_pk, get_by_pk, seed_instance
 from skrift.db.models import Page
@@ -143,6 +145,7 @@ async def get_page_by_slug(
     slug: str,
     published_only: bool = False,
     page_type: str | None = None,
+    options: Sequence[ExecutableOption] | None = None,
 ) -> Page | None:
     """Get a single page by slug.
 
@@ -150,12 +153,16 @@ async def get_page_by_slug(
         db_session: Database session
         slug: Page slug
         published_only: Only return if published (respects scheduling)
+        options: Loader options (e.g. ``load_only`` on the asset relationships)
 
     Returns:
         Page object or None if not found
     """
     query = select(Page).where(Page.slug == slug)
 
+    if options:
+        query = query.options(*options)
+
     if page_type is not None:
         query = query.where(Page.type == page_type)
 
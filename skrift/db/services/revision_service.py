@@ -4,8 +4,9 @@ from uuid import UUID
 
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from skrift.db.models import Page, PageRevision
+from skrift.db.models import Page, PageRevision, User
 
 
 async def create_revision(
@@ -59,11 +60,15 @@ async def list_revisions(
         limit: Maximum number of revisions to return (None for all)
 
     Returns:
-        List of PageRevision objects ordered by revision_number descending
+        List of PageRevision objects ordered by revision_number descending,
+        with each revision's author loaded
     """
+    # The revision list shows each author's name, so load them in one
+    # query rather than lazily per row; their roles are never shown.
     query = (
         select(PageRevision)
         .where(PageRevision.page_id == page_id)
+        .options(selectinload(PageRevision.user).lazyload(User.roles))
         .order_by(PageRevision.revision_number.desc())
     )
 
@@ -71,7 +76,7 @@ async def list_revisions(
         query = query.limit(limit)
 
     result = await db_session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def get_revision(
@@ -50,6 +50,16 @@ def add_flash(
     })
 
 
+def pop_flash(request: "Request") -> str | None:
+    """Pop the legacy single-string flash from the session.
+
+    Checks for the key first so the common no-flash request never mutates
+    the session.
+    """
+    session = request.session
+    return session.pop("flash", None) if "flash" in session else None
+
+
 def get_flash_messages(request: "Request") -> list[FlashMessage]:
     """Get and clear all flash messages from the session.
 
@@ -61,10 +71,16 @@ def get_flash_messages(request: "Request") -> list[FlashMessage]:
     Returns:
         List of FlashMessage objects
     """
-    messages = request.session.pop("flash_messages", [])
+    session = request.session
+    # Nearly every page render has nothing queued; answer from the session
+    # dict already in hand without touching it further.
+    if "flash_messages" not in session and "flash" not in session:
+        return []
+
+    messages = session.pop("flash_messages") if "flash_messages" in session else []
 
     # Backwards compatibility: convert old single-string flash
-    old_flash = request.session.pop("flash", None)
+    old_flash = session.pop("flash", None)
     if old_flash:
         messages.insert(0, {
             "message": old_flash,
@@ -29,12 +29,16 @@ Usage:
 """
 
 import asyncio
+import inspect
+import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(order=True)
 class HookHandler:
@@ -42,9 +46,17 @@ class HookHandler:
 
     priority: int
     callback: Callable = field(compare=False)
+    # Resolved once at registration so call() can await coroutine
+    # functions directly instead of inspecting every return value.
+    is_async: bool = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.is_async = inspect.iscoroutinefunction(self.callback)
 
     async def call(self, *args: Any, **kwargs: Any) -> Any:
         """Call the handler, handling both sync and async callbacks."""
+        if self.is_async:
+            return await self.callback(*args, **kwargs)
         result = self.callback(*args, **kwargs)
         if asyncio.iscoroutine(result):
             return await result
@@ -57,6 +69,9 @@ class HookRegistry:
     def __init__(self) -> None:
         self._actions: dict[str, list[HookHandler]] = defaultdict(list)
         self._filters: dict[str, list[HookHandler]] = defaultdict(list)
+        # Strong references to in-flight background actions so they aren't
+        # garbage collected before they finish
+        self._background: set[asyncio.Task] = set()
 
     def add_action(
         self,
@@ -142,6 +157,10 @@ class HookRegistry:
         """Check if any filters are registered for a hook."""
         return bool(self._filters.get(hook_name))
 
+    def get_filters(self, hook_name: str) -> tuple[Callable[..., Any], ...]:
+        """Return the callbacks registered for a filter, in call order."""
+        return tuple(handler.callback for handler in self._filters.get(hook_name, ()))
+
     async def do_action(
         self,
         hook_name: str,
@@ -155,13 +174,54 @@ class HookRegistry:
             *args: Positional arguments to pass to callbacks
             **kwargs: Keyword arguments to pass to callbacks
         """
+        handlers = self._actions.get(hook_name)
+        if not handlers:
+            return
+
         from skrift.lib.observability import span
 
         with span(f"hook.action:{hook_name}", hook_name=hook_name):
-            handlers = self._actions.get(hook_name, [])
             for handler in handlers:
                 await handler.call(*args, **kwargs)
 
+    def do_action_background(
+        self,
+        hook_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> asyncio.Task | None:
+        """Run an action's callbacks in a background task without waiting.
+
+        For actions whose callbacks the caller doesn't depend on, such as
+        notifications sent after a write has committed. Callbacks still run
+        in priority order; an exception stops the remaining callbacks and is
+        logged rather than raised. Arguments should not be objects bound to
+        a database session the caller is about to close.
+
+        Args:
+            hook_name: Name of the action hook
+            *args: Positional arguments to pass to callbacks
+            **kwargs: Keyword arguments to pass to callbacks
+
+        Returns:
+            The scheduled task, or None if no callbacks are registered
+        """
+        if not self._actions.get(hook_name):
+            return None
+
+        task = asyncio.create_task(self._run_background_action(hook_name, args, kwargs))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+    async def _run_background_action(
+        self, hook_name: str, args: tuple, kwargs: dict[str, Any]
+    ) -> None:
+        try:
+            await self.do_action(hook_name, *args, **kwargs)
+        except Exception:
+            logger.exception("Background action %r failed", hook_name)
+
     async def apply_filters(
         self,
         hook_name: str,
@@ -180,10 +240,13 @@ class HookRegistry:
         Returns:
             The filtered value after all callbacks have been applied
         """
+        handlers = self._filters.get(hook_name)
+        if not handlers:
+            return value
+
         from skrift.lib.observability import span
 
         with span(f"hook.filter:{hook_name}", hook_name=hook_name):
-            handlers = self._filters.get(hook_name, [])
             for handler in handlers:
                 value = await handler.call(value, *args, **kwargs)
             return value
@@ -245,6 +308,11 @@ async def do_action(hook_name: str, *args: Any, **kwargs: Any) -> None:
     await hooks.do_action(hook_name, *args, **kwargs)
 
 
+def do_action_background(hook_name: str, *args: Any, **kwargs: Any) -> asyncio.Task | None:
+    """Run an action's callbacks in a background task via the global registry."""
+    return hooks.do_action_background(hook_name, *args, **kwargs)
+
+
 async def apply_filters(hook_name: str, value: T, *args: Any, **kwargs: Any) -> T:
     """Apply all registered filter callbacks via the global registry."""
     return await hooks.apply_filters(hook_name, value, *args, **kwargs)
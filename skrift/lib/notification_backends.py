@@ -521,7 +521,7 @@ class _DatabaseStorageMixin(_PeriodicCleanupMixin):
                     DismissedNotification.notification_id.in_(notification_ids),
                 )
             )
-            return set(result.scalars().all())
+            return set(result.scalars())
 
     async def cleanup_dismissed(self) -> None:
         from skrift.db.models.notification import DismissedNotification, StoredNotification
@@ -47,6 +47,7 @@ from skrift.setup.config_writer import (
     update_auth_config,
     update_database_config,
 )
+from skrift.flash import pop_flash
 from skrift.forms import verify_csrf
 from skrift.forms.core import CSRF_SESSION_KEY
 from skrift.setup.providers import DUMMY_PROVIDER_KEY, OAUTH_PROVIDERS, get_all_providers, get_provider_info
@@ -313,7 +314,7 @@ class SetupController(Controller):
     @get("/database")
     async def database_step(self, request: Request) -> TemplateResponse | Redirect:
         """Step 1: Database configuration."""
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
 
         # If database is already configured and no errors, go to configuring page
@@ -387,7 +388,7 @@ class SetupController(Controller):
 
         Shows a loading spinner while migrations run via SSE.
         """
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
 
         # Verify we can connect to the database first
@@ -478,7 +479,7 @@ class SetupController(Controller):
     @get("/auth")
     async def auth_step(self, request: Request) -> TemplateResponse | Redirect:
         """Step 2: Authentication providers."""
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
 
         # If auth is already configured and no errors, skip to next step
@@ -581,7 +582,7 @@ class SetupController(Controller):
     @get("/site")
     async def site_step(self, request: Request) -> TemplateResponse | Redirect:
         """Step 3: Site settings."""
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
 
         # If site is already configured and no errors, skip to next step
@@ -696,7 +697,7 @@ class SetupController(Controller):
                 request.session["setup_wizard_step"] = next_step.value
                 return Redirect(path=f"/setup/{next_step.value}")
 
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
         themes = discover_themes()
 
@@ -759,7 +760,7 @@ class SetupController(Controller):
     @get("/admin")
     async def admin_step(self, request: Request) -> TemplateResponse:
         """Admin account creation step."""
-        flash = request.session.pop("flash", None)
+        flash = pop_flash(request)
         error = request.session.pop("setup_error", None)
 
         if not error:
@@ -810,7 +811,7 @@ class SetupController(Controller):
 
         method_config = methods_config.get(provider, {})
         if _get_method_type(provider, method_config) == "passkey":
-            flash = request.session.pop("flash", None)
+            flash = pop_flash(request)
             return TemplateResponse(
                 "setup/passkey_login.html",
                 context={
@@ -829,7 +830,7 @@ class SetupController(Controller):
 
         # Dummy provider uses a local form instead of OAuth redirect
         if provider == DUMMY_PROVIDER_KEY:
-            flash = request.session.pop("flash", None)
+            flash = pop_flash(request)
             return TemplateResponse(
                 "setup/dummy_login.html",
                 context={
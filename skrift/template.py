@@ -1,3 +1,5 @@
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -6,6 +8,67 @@ from litestar.contrib.jinja import JinjaTemplateEngine
 from litestar.response import Template as TemplateResponse
 from litestar.template import TemplateConfig
 
+# Resolution results are memoized per (search dirs, type, slugs) because the
+# same handful of slug combinations is resolved on every request. Debug mode
+# turns this off so newly added template files are picked up immediately.
+_resolve_cache_enabled = True
+
+
+def set_template_cache_enabled(enabled: bool) -> None:
+    """Enable or disable memoized template resolution for this process."""
+    global _resolve_cache_enabled
+    _resolve_cache_enabled = enabled
+    _resolve_cached.cache_clear()
+    _template_names.cache_clear()
+
+
+def _list_template_names(search_dir: str) -> frozenset[str]:
+    """Return the file names in a template directory using a single scandir."""
+    try:
+        with os.scandir(search_dir) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+
+
+_template_names = lru_cache(maxsize=64)(_list_template_names)
+
+
+@lru_cache(maxsize=4096)
+def _template_candidates(template_type: str, slugs: tuple[str, ...]) -> tuple[str, ...]:
+    """Build template names to try, from most to least specific."""
+    candidates = [
+        f"{template_type}-{'-'.join(slugs[:i])}.html" for i in range(len(slugs), 0, -1)
+    ]
+    candidates.append(f"{template_type}.html")
+    return tuple(candidates)
+
+
+def _resolve_uncached(
+    search_dirs: tuple[str, ...],
+    template_type: str,
+    slugs: tuple[str, ...],
+    list_names=_list_template_names,
+) -> str:
+    candidates = _template_candidates(template_type, slugs)
+    # Search each directory fully (most-specific to least-specific) before
+    # moving to the next, so theme templates always beat package templates.
+    for search_dir in search_dirs:
+        names = list_names(search_dir)
+        for template_name in candidates:
+            if template_name in names:
+                return template_name
+
+    # Default to base template even if it doesn't exist (let Jinja handle the error)
+    return candidates[-1]
+
+
+@lru_cache(maxsize=4096)
+def _resolve_cached(
+    search_dirs: tuple[str, ...], template_type: str, slugs: tuple[str, ...]
+) -> str:
+    return _resolve_uncached(search_dirs, template_type, slugs, _template_names)
+
 
 class Template:
     """WordPress-like template resolver with fallback support.
@@ -39,15 +102,9 @@ class Template:
         self.context = context or {}
         self._resolved_template: str | None = None
 
-    def _candidates(self) -> list[str]:
-        """Build list of template names to try, from most to least specific."""
-        candidates = []
-        if self.slugs:
-            for i in range(len(self.slugs), 0, -1):
-                slug_part = "-".join(self.slugs[:i])
-                candidates.append(f"{self.template_type}-{slug_part}.html")
-        candidates.append(f"{self.template_type}.html")
-        return candidates
+    def _candidates(self) -> tuple[str, ...]:
+        """Template names to try, from most to least specific."""
+        return _template_candidates(self.template_type, self.slugs)
 
     def resolve(self, template_dir: Path, theme_name: str = "") -> str:
         """Resolve the most specific template that exists.
@@ -64,20 +121,19 @@ class Template:
 
         from skrift.app_factory import get_template_directories_for_theme
 
-        search_dirs = get_template_directories_for_theme(theme_name)
-
-        # Search each directory fully (most-specific to least-specific) before
-        # moving to the next, so theme templates always beat package templates.
-        for search_dir in search_dirs:
-            for template_name in self._candidates():
-                template_path = search_dir / template_name
-                if template_path.exists():
-                    self._resolved_template = template_name
-                    return template_name
-
-        # Default to base template even if it doesn't exist (let Jinja handle the error)
-        self._resolved_template = f"{self.template_type}.html"
-        return self._resolved_template
+        search_dirs = tuple(str(d) for d in get_template_directories_for_theme(theme_name))
+        if _resolve_cache_enabled:
+            resolved = _resolve_cached(search_dirs, self.template_type, self.slugs)
+        else:
+            resolved = _resolve_uncached(search_dirs, self.template_type, self.slugs)
+        self._resolved_template = resolved
+        return resolved
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget memoized resolutions, e.g. after templates change on disk."""
+        _resolve_cached.cache_clear()
+        _template_names.cache_clear()
 
     def try_render(self, template_engine, **context) -> str | None:
         """Attempt to render using the template hierarchy.
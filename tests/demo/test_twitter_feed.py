@@ -0,0 +1,119 @@
+"""Tests for the twitter demo's feed controller and anonymous list cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+DEMO_ROOT = Path(__file__).resolve().parents[2] / "demo" / "twitter"
+
+
+@pytest.fixture(autouse=True)
+def demo_path():
+    if str(DEMO_ROOT) not in sys.path:
+        sys.path.insert(0, str(DEMO_ROOT))
+
+
+@pytest.fixture
+def feed_service():
+    from twitter.services import feed_service
+
+    feed_service._anonymous_list_cache.clear()
+    yield feed_service
+    feed_service._anonymous_list_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_tweet_context_carries_tweets_for_logged_in_views(feed_service):
+    """Logged-in timeline, explore and search pages take their tweets from here."""
+    from twitter.controllers.feed import FeedController
+
+    controller = FeedController(owner=MagicMock())
+    cards = [MagicMock()]
+    state = feed_service.InteractionState(set(), set(), set())
+
+    with (
+        patch.object(feed_service, "build_tweet_cards", new_callable=AsyncMock, return_value=cards),
+        patch("twitter.controllers.feed.csrf_field", return_value=""),
+    ):
+        ctx = await controller._tweet_context(
+            MagicMock(), [MagicMock()], MagicMock(), AsyncMock(), state
+        )
+
+    assert ctx["tweets"] is cards
+
+
+class TestAnonymousListCache:
+    """Tests for the rendered tweet lists shared by logged-out viewers."""
+
+    def test_hit_returns_cached_html(self, feed_service):
+        feed_service.cache_anonymous_list(("timeline",), "<ol></ol>")
+
+        assert feed_service.get_cached_anonymous_list(("timeline",)) == "<ol></ol>"
+        assert feed_service.get_cached_anonymous_list(("explore",)) is None
+
+    def test_entry_expires_after_ttl(self, feed_service):
+        with patch.object(feed_service.time, "monotonic", return_value=1000.0):
+            feed_service.cache_anonymous_list(("timeline",), "<ol></ol>")
+
+        expires_at = 1000.0 + feed_service.ANONYMOUS_LIST_TTL
+        with patch.object(feed_service.time, "monotonic", return_value=expires_at - 1):
+            assert feed_service.get_cached_anonymous_list(("timeline",)) == "<ol></ol>"
+        with patch.object(feed_service.time, "monotonic", return_value=expires_at):
+            assert feed_service.get_cached_anonymous_list(("timeline",)) is None
+
+        assert ("timeline",) not in feed_service._anonymous_list_cache
+
+    def test_least_recently_used_entry_is_evicted(self, feed_service, monkeypatch):
+        monkeypatch.setattr(feed_service, "MAX_ANONYMOUS_LIST_ENTRIES", 2)
+        feed_service.cache_anonymous_list(("timeline",), "a")
+        feed_service.cache_anonymous_list(("explore",), "b")
+        feed_service.get_cached_anonymous_list(("timeline",))
+
+        feed_service.cache_anonymous_list(("search", "skrift"), "c")
+
+        assert feed_service.get_cached_anonymous_list(("explore",)) is None
+        assert feed_service.get_cached_anonymous_list(("timeline",)) == "a"
+        assert feed_service.get_cached_anonymous_list(("search", "skrift")) == "c"
+
+    @pytest.mark.asyncio
+    async def test_tweet_save_and_delete_clear_the_cache(self, feed_service):
+        from twitter.hooks import AFTER_TWEET_DELETE, AFTER_TWEET_SAVE
+
+        from skrift.hooks import hooks
+
+        for hook_name in (AFTER_TWEET_SAVE, AFTER_TWEET_DELETE):
+            callbacks = [handler.callback for handler in hooks._actions[hook_name]]
+            assert feed_service.invalidate_anonymous_lists in callbacks
+
+            feed_service.cache_anonymous_list(("timeline",), "<ol></ol>")
+            await feed_service.invalidate_anonymous_lists(MagicMock(), is_new=True)
+
+            assert feed_service.get_cached_anonymous_list(("timeline",)) is None
+
+    @pytest.mark.asyncio
+    async def test_anonymous_tweet_list_renders_only_on_miss(self, feed_service):
+        from twitter.controllers.feed import FeedController
+
+        controller = FeedController(owner=MagicMock())
+        request = MagicMock()
+        template = request.app.template_engine.get_template.return_value
+        template.render.return_value = "<ol></ol>"
+        load = AsyncMock(return_value=[])
+
+        with patch.object(
+            FeedController, "_tweet_context", new_callable=AsyncMock, return_value={}
+        ):
+            first = await controller._anonymous_tweet_list(
+                request, AsyncMock(), ("timeline",), load
+            )
+            second = await controller._anonymous_tweet_list(
+                request, AsyncMock(), ("timeline",), load
+            )
+
+        assert first == second == "<ol></ol>"
+        load.assert_awaited_once()
+        template.render.assert_called_once()
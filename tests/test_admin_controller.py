@@ -576,3 +576,39 @@ class TestAdminNavHelper:
         for name in ("get_admin_context", "admin_nav", "ADMIN_NAV_TAG"):
             assert name in admin.__all__
             assert hasattr(admin, name)
+
+
+class TestBuildAdminNav:
+    """Tests for build_admin_nav() route introspection."""
+
+    @pytest.mark.asyncio
+    async def test_route_scan_cached_but_guards_checked_per_user(self):
+        from litestar import Litestar, get
+
+        from skrift.admin import admin_nav
+        from skrift.admin.navigation import build_admin_nav
+        from skrift.auth.guards import Permission, auth_guard
+        from skrift.auth.services import UserPermissions
+
+        @get("/reports", guards=[auth_guard, Permission("view-reports")],
+             **admin_nav("Reports", order=5), sync_to_thread=False)
+        def reports() -> str:
+            return ""
+
+        @get("/home", guards=[auth_guard], **admin_nav("Home", order=1), sync_to_thread=False)
+        def home() -> str:
+            return ""
+
+        app = Litestar([reports, home])
+        viewer = UserPermissions(user_id="1")
+        editor = UserPermissions(user_id="2", permissions={"view-reports"})
+
+        assert [i.label for i in await build_admin_nav(app, viewer)] == ["Home"]
+        assert [i.label for i in await build_admin_nav(app, editor)] == ["Home", "Reports"]
+
+        @get("/late", **admin_nav("Late", order=0), sync_to_thread=False)
+        def late() -> str:
+            return ""
+
+        app.register(late)
+        assert [i.label for i in await build_admin_nav(app, editor)] == ["Late", "Home", "Reports"]
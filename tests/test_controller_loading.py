@@ -0,0 +1,33 @@
+"""Tests for controller loading from import specs."""
+
+import importlib
+from unittest.mock import patch
+
+import pytest
+
+from skrift.asgi import load_site_controllers
+
+
+class TestLoadSiteControllers:
+    def test_loads_classes_in_order(self):
+        from collections import OrderedDict, defaultdict
+
+        result = load_site_controllers(
+            ["collections:OrderedDict", "collections:defaultdict"]
+        )
+
+        assert result == [OrderedDict, defaultdict]
+
+    def test_shared_module_is_imported_once(self):
+        with patch(
+            "skrift.asgi.importlib.import_module", wraps=importlib.import_module
+        ) as mock_import:
+            load_site_controllers(
+                ["collections:OrderedDict", "collections:defaultdict", "json:JSONDecoder"]
+            )
+
+        assert [c.args[0] for c in mock_import.call_args_list] == ["collections", "json"]
+
+    def test_duplicate_controller_raises(self):
+        with pytest.raises(ValueError, match="Duplicate controller"):
+            load_site_controllers(["collections:OrderedDict", "collections:OrderedDict"])
@@ -154,3 +154,41 @@ def test_missing_pk_reads_are_cached_within_one_asgi_request():
         "same_object": True,
         "page_pk_select_count": 1,
     }
+
+
+async def test_get_current_user_loads_user_once_per_session():
+    from types import SimpleNamespace
+
+    from skrift.controllers.helpers import get_current_user
+    from skrift.db.models.user import User
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    user_selects = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count_user_selects(_conn, _cursor, statement, *_args):
+        nonlocal user_selects
+        normalized = " ".join(statement.lower().split())
+        if normalized.startswith("select ") and " from users " in normalized:
+            user_selects += 1
+
+    try:
+        await _create_schema(engine)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            user = User(email="viewer@example.com", name="Viewer")
+            session.add(user)
+            await session.commit()
+            user_selects = 0
+
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            request = SimpleNamespace(session={"user_id": str(user.id)})
+            first = await get_current_user(request, session)
+            second = await get_current_user(request, session)
+            anonymous = await get_current_user(SimpleNamespace(session={}), session)
+    finally:
+        await engine.dispose()
+
+    assert first is second
+    assert first.id == user.id
+    assert anonymous is None
+    assert user_selects == 1
@@ -11,6 +11,7 @@ from skrift.flash import (
     flash_error,
     flash_warning,
     flash_info,
+    pop_flash,
 )
 
 
@@ -173,3 +174,32 @@ class TestConvenienceFunctions:
 
         msg = mock_request.session["flash_messages"][0]
         assert msg["dismissible"] is False
+
+
+class _RecordingSession(dict):
+    """Session dict that records mutating pops."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.popped: list[str] = []
+
+    def pop(self, key, *args):
+        self.popped.append(key)
+        return super().pop(key, *args)
+
+
+class TestPopFlash:
+    """Test pop_flash()."""
+
+    def test_pop_flash_returns_and_removes_value(self, mock_request_factory):
+        request = mock_request_factory(session={"flash": "Saved"})
+
+        assert pop_flash(request) == "Saved"
+        assert "flash" not in request.session
+
+    def test_pop_flash_leaves_empty_session_untouched(self, mock_request_factory):
+        request = mock_request_factory(session=_RecordingSession())
+
+        assert pop_flash(request) is None
+        assert get_flash_messages(request) == []
+        assert request.session.popped == []
@@ -137,6 +137,64 @@ class TestHookRegistry:
         result = await registry.apply_filters("test", "start")
         assert result == "start_sync_async"
 
+    @pytest.mark.asyncio
+    async def test_sync_callable_returning_coroutine_is_awaited(self, registry):
+        """Test that a sync wrapper around a coroutine function is still awaited."""
+        import functools
+
+        async def add_suffix(value, suffix):
+            return value + suffix
+
+        registry.add_filter("test", functools.partial(add_suffix, suffix="_wrapped"))
+        result = await registry.apply_filters("test", "start")
+
+        assert result == "start_wrapped"
+
+    @pytest.mark.asyncio
+    async def test_do_action_background_runs_handlers_in_task(self, registry):
+        """Test that do_action_background schedules handlers without awaiting them."""
+        results = []
+
+        async def async_handler(value):
+            results.append(value)
+
+        registry.add_action("test", async_handler)
+        task = registry.do_action_background("test", "background")
+
+        assert results == []
+        await task
+        assert results == ["background"]
+
+    @pytest.mark.asyncio
+    async def test_do_action_background_logs_handler_errors(self, registry, caplog):
+        """Test that a failing background handler is logged, not raised."""
+        def failing_handler():
+            raise RuntimeError("boom")
+
+        registry.add_action("test", failing_handler)
+        await registry.do_action_background("test")
+
+        assert "Background action 'test' failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_do_action_background_without_handlers(self, registry):
+        """Test that no task is scheduled when nothing is registered."""
+        assert registry.do_action_background("test") is None
+
+    def test_get_filters_returns_callbacks_in_priority_order(self, registry):
+        """Test that get_filters lists callbacks in the order they run."""
+        def first(value):
+            return value
+
+        def second(value):
+            return value
+
+        registry.add_filter("test", second, priority=20)
+        registry.add_filter("test", first, priority=5)
+
+        assert registry.get_filters("test") == (first, second)
+        assert registry.get_filters("missing") == ()
+
     def test_remove_action(self, registry):
         """Test removing an action handler."""
         def my_handler():
@@ -111,3 +111,26 @@ class TestMediaAdminController:
         assert response.status_code == 500
         assert response.content == {"error": "Upload failed. Check the server logs."}
         mock_log.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_media_picker_resolves_urls_in_one_batch(self):
+        from skrift.admin.media import MediaAdminController
+
+        controller = MediaAdminController(owner=MagicMock())
+        request = MagicMock()
+        db_session = AsyncMock()
+        assets = [MagicMock(id="a1"), MagicMock(id="a2")]
+
+        with patch("skrift.admin.media.list_assets", new_callable=AsyncMock, return_value=assets), \
+             patch("skrift.admin.media.count_assets", new_callable=AsyncMock, return_value=2), \
+             patch(
+                 "skrift.admin.media.get_asset_urls",
+                 new_callable=AsyncMock,
+                 return_value=["/u/1", "/u/2"],
+             ) as mock_get_asset_urls:
+            response = await MediaAdminController.media_picker.fn(
+                controller, request, db_session
+            )
+
+        assert response.context["asset_urls"] == {"a1": "/u/1", "a2": "/u/2"}
+        mock_get_asset_urls.assert_awaited_once_with(request.app.state.storage_manager, assets)
@@ -8,7 +8,12 @@ import pytest
 
 from litestar.middleware import DefineMiddleware
 
-from skrift.asgi import _load_middleware_factory, load_middleware
+from skrift.asgi import (
+    _app_yaml_cache_path,
+    _load_middleware_factory,
+    _read_app_yaml,
+    load_middleware,
+)
 
 
 class TestLoadMiddlewareFactory:
@@ -266,3 +271,46 @@ def local_factory(app):
         # Clean up
         if "local_middleware" in sys.modules:
             del sys.modules["local_middleware"]
+
+
+class TestAppYamlCache:
+    """Tests for the JSON sidecar cache used when reading app.yaml."""
+
+    def test_parse_writes_sidecar(self, temp_app_yaml):
+        config_path = temp_app_yaml({"middleware": ["os.path:join"]})
+
+        assert _read_app_yaml(config_path) == {"middleware": ["os.path:join"]}
+        assert _app_yaml_cache_path(config_path).exists()
+
+    def test_hit_skips_yaml_parse(self, temp_app_yaml):
+        config_path = temp_app_yaml({"controllers": ["a:B"]})
+        _read_app_yaml(config_path)
+
+        with patch("yaml.load") as mock_load:
+            assert _read_app_yaml(config_path) == {"controllers": ["a:B"]}
+        mock_load.assert_not_called()
+
+    def test_changed_file_invalidates_sidecar(self, temp_app_yaml):
+        config_path = temp_app_yaml({"controllers": ["a:B"]})
+        _read_app_yaml(config_path)
+
+        temp_app_yaml({"controllers": ["a:B", "c:DeeEee"]})
+
+        assert _read_app_yaml(config_path) == {"controllers": ["a:B", "c:DeeEee"]}
+
+    def test_non_json_values_are_not_cached(self, tmp_path):
+        config_path = tmp_path / "app.yaml"
+        config_path.write_text("released: 2026-01-01\n")
+
+        config = _read_app_yaml(config_path)
+
+        assert str(config["released"]) == "2026-01-01"
+        assert not _app_yaml_cache_path(config_path).exists()
+
+    def test_sidecar_is_no_more_readable_than_config(self, temp_app_yaml):
+        config_path = temp_app_yaml({"controllers": ["a:B"]})
+        config_path.chmod(0o600)
+
+        _read_app_yaml(config_path)
+
+        assert _app_yaml_cache_path(config_path).stat().st_mode & 0o077 == 0
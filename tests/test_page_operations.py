@@ -55,6 +55,51 @@ class TestListPagesForAdmin:
         query = db_session.execute.await_args.args[0]
         assert user_id in query.compile().params.values()
 
+    @pytest.mark.asyncio
+    async def test_limit_and_offset_select_one_page(self):
+        from skrift.admin.page_operations import list_pages_for_admin
+
+        db_session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        db_session.execute.return_value = result
+
+        await list_pages_for_admin(
+            db_session,
+            page_type_name="post",
+            user_id=uuid4(),
+            permissions=SimpleNamespace(permissions={"manage-posts"}),
+            manage_permission="manage-posts",
+            limit=50,
+            offset=100,
+        )
+
+        params = db_session.execute.await_args.args[0].compile().params.values()
+        assert 50 in params
+        assert 100 in params
+
+    @pytest.mark.asyncio
+    async def test_count_is_scoped_like_the_list(self):
+        from skrift.admin.page_operations import count_pages_for_admin
+
+        db_session = AsyncMock()
+        result = MagicMock()
+        result.scalar.return_value = 3
+        db_session.execute.return_value = result
+
+        user_id = uuid4()
+        total = await count_pages_for_admin(
+            db_session,
+            page_type_name="post",
+            user_id=user_id,
+            permissions=SimpleNamespace(permissions={"edit-own-posts"}),
+            manage_permission="manage-posts",
+        )
+
+        assert total == 3
+        query = db_session.execute.await_args.args[0]
+        assert user_id in query.compile().params.values()
+
 
 class TestTypedPageMutations:
     @pytest.mark.asyncio
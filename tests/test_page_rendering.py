@@ -56,10 +56,10 @@ class TestBuildPublicPageRenderContext:
                 return_value="theme",
             ),
             patch(
-                "skrift.controllers.page_rendering.get_asset_url",
+                "skrift.controllers.page_rendering.get_asset_urls",
                 new_callable=AsyncMock,
-                return_value="https://cdn.example.com/featured.jpg",
-            ) as mock_get_asset_url,
+                return_value=["https://cdn.example.com/featured.jpg"],
+            ) as mock_get_asset_urls,
             patch(
                 "skrift.controllers.page_rendering.image_url",
                 new_callable=AsyncMock,
@@ -100,7 +100,7 @@ class TestBuildPublicPageRenderContext:
         # any backend, including remote/CDN-backed stores.
         assert render_ctx.featured_image_url == "/storage/default/featured"
         assert request.session == {}
-        assert mock_get_asset_url.await_count == 1
+        assert mock_get_asset_urls.await_count == 1
         assert mock_get_og_meta.await_args.kwargs["featured_image_url"] == (
             "/storage/default/featured"
         )
@@ -0,0 +1,89 @@
+"""Tests for the Redis-backed server-side session backend."""
+
+from unittest.mock import MagicMock
+
+import fakeredis.aioredis
+import pytest
+from litestar import Litestar
+
+from skrift.app_factory import _ServerSideSessionBackend, create_redis_session_config
+from skrift.config import SessionConfig
+
+
+def _make_config(redis_client):
+    return create_redis_session_config(redis_client, namespace="test:sessions")
+
+
+def _make_connection(cookies: dict):
+    conn = MagicMock()
+    conn.cookies = cookies
+    conn.get_session_id.return_value = None
+    conn.scope = {"app": MagicMock(), "route_handler": None, "litestar_app": Litestar()}
+    return conn
+
+
+def _set_cookies(message: dict) -> list[str]:
+    return [
+        v.decode() if isinstance(v, bytes) else v
+        for k, v in message["headers"]
+        if (k.decode() if isinstance(k, bytes) else k).lower() == "set-cookie"
+    ]
+
+
+def _start_message() -> dict:
+    return {"type": "http.response.start", "headers": []}
+
+
+class TestRedisSessionBackend:
+    def test_default_backend_is_cookie(self):
+        assert SessionConfig().backend == "cookie"
+
+    def test_middleware_creates_server_side_backend(self):
+        config = _make_config(fakeredis.aioredis.FakeRedis())
+
+        assert isinstance(config.middleware.kwargs["backend"], _ServerSideSessionBackend)
+
+    @pytest.mark.asyncio
+    async def test_round_trips_session_through_redis(self):
+        redis = fakeredis.aioredis.FakeRedis()
+        backend = _ServerSideSessionBackend(_make_config(redis))
+
+        message = _start_message()
+        await backend.store_in_message({"theme": "dark"}, message, _make_connection({}))
+
+        [cookie] = _set_cookies(message)
+        session_id = cookie.split(";")[0].split("=", 1)[1]
+        loaded = await backend.load_from_connection(_make_connection({"session": session_id}))
+        assert loaded == {"theme": "dark"}
+
+    @pytest.mark.asyncio
+    async def test_empty_anonymous_session_writes_nothing(self):
+        redis = fakeredis.aioredis.FakeRedis()
+        backend = _ServerSideSessionBackend(_make_config(redis))
+
+        message = _start_message()
+        await backend.store_in_message({}, message, _make_connection({}))
+
+        assert _set_cookies(message) == []
+        assert await redis.keys("*") == []
+
+    @pytest.mark.asyncio
+    async def test_login_rotates_session_id(self):
+        redis = fakeredis.aioredis.FakeRedis()
+        backend = _ServerSideSessionBackend(_make_config(redis))
+
+        first = _start_message()
+        await backend.store_in_message({"csrf": "x"}, first, _make_connection({}))
+        old_id = _set_cookies(first)[0].split(";")[0].split("=", 1)[1]
+
+        conn = _make_connection({"session": old_id})
+        await backend.load_from_connection(conn)
+        second = _start_message()
+        await backend.store_in_message({"user_id": "123"}, second, conn)
+
+        new_id = _set_cookies(second)[0].split(";")[0].split("=", 1)[1]
+        assert new_id != old_id
+        assert await backend.load_from_connection(_make_connection({"session": old_id})) == {}
+        assert await backend.load_from_connection(
+            _make_connection({"session": new_id})
+        ) == {"user_id": "123"}
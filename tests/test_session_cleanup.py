@@ -1,7 +1,7 @@
 """Tests for SQLAlchemy session cleanup on request cancellation."""
 
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -38,6 +38,39 @@ class TestDatabaseConfig:
         assert config.pool_pre_ping is False
         assert config.pool_recycle == 1800
 
+    def test_pool_prewarm_defaults_to_true(self):
+        """pool_prewarm should open connections at startup by default."""
+        config = DatabaseConfig()
+        assert config.pool_prewarm is True
+
+
+class TestPrewarmDatabasePool:
+    """Tests for opening pooled connections at startup."""
+
+    @pytest.mark.asyncio
+    async def test_opens_and_releases_pool_size_connections(self):
+        """Each prewarmed connection is opened and then returned to the pool."""
+        from skrift.asgi import _prewarm_database_pool
+
+        connection = AsyncMock()
+        engine = MagicMock()
+        engine.connect = AsyncMock(return_value=connection)
+
+        await _prewarm_database_pool(engine, 3)
+
+        assert engine.connect.await_count == 3
+        assert connection.close.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_connect_failures_are_not_raised(self):
+        """A database that can't be reached doesn't fail startup."""
+        from skrift.asgi import _prewarm_database_pool
+
+        engine = MagicMock()
+        engine.connect = AsyncMock(side_effect=OSError("unreachable"))
+
+        await _prewarm_database_pool(engine, 2)
+
 
 class TestSessionCleanupMiddleware:
     """Tests for SessionCleanupMiddleware."""
@@ -14,6 +14,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from litestar import Litestar
 from litestar.middleware.session.client_side import AAD, NONCE_SIZE
 from litestar.serialization import encode_json
 
@@ -32,11 +33,11 @@ def _make_config(secret: bytes, domain: str | None = ".example.com"):
     )
 
 
-def _encrypt_session(secret: bytes, data: dict) -> str:
+def _encrypt_session(secret: bytes, data: dict, expires_in: int = 86400) -> str:
     """Encrypt session data the same way Litestar does."""
     aesgcm = AESGCM(secret)
     nonce = urandom(NONCE_SIZE)
-    aad_data = encode_json({"expires_at": round(time.time()) + 86400})
+    aad_data = encode_json({"expires_at": round(time.time()) + expires_in})
     encrypted = aesgcm.encrypt(nonce, encode_json(data), associated_data=aad_data)
     raw = nonce + encrypted + AAD + aad_data
     return b64encode(raw).decode("utf-8")
@@ -172,3 +173,67 @@ class TestSessionConfigUsesCustomBackend:
         config = _make_config(hashlib.sha256(b"test").digest())
         middleware_def = config.middleware
         assert middleware_def.kwargs["backend"].__class__ is _SessionBackend
+
+
+class TestUnchangedSessionSkipsCookie:
+    """An unchanged session keeps the browser's cookie instead of re-encrypting."""
+
+    @staticmethod
+    def _set_cookies(message: dict) -> list[str]:
+        return [
+            v.decode() if isinstance(v, bytes) else v
+            for k, v in message["headers"]
+            if (k.decode() if isinstance(k, bytes) else k).lower() == "set-cookie"
+        ]
+
+    async def _round_trip(self, backend, cookie_value: str, mutate=None) -> list[str]:
+        conn = _make_connection(
+            {"session": cookie_value},
+            {"route_handler": None, "litestar_app": Litestar()},
+        )
+        session = await backend.load_from_connection(conn)
+        if mutate is not None:
+            mutate(session)
+        message = {"type": "http.response.start", "headers": []}
+        await backend.store_in_message(session, message, conn)
+        return self._set_cookies(message)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_session_sets_no_cookie(self):
+        secret = hashlib.sha256(b"test-key").digest()
+        backend = _SessionBackend(_make_config(secret, domain=None))
+
+        cookies = await self._round_trip(backend, _encrypt_session(secret, {"user_id": "123"}))
+
+        assert cookies == []
+
+    @pytest.mark.asyncio
+    async def test_nested_mutation_rewrites_cookie(self):
+        secret = hashlib.sha256(b"test-key").digest()
+        backend = _SessionBackend(_make_config(secret, domain=None))
+        cookie_value = _encrypt_session(secret, {"flash_messages": [{"message": "a"}]})
+
+        cookies = await self._round_trip(
+            backend, cookie_value, lambda s: s["flash_messages"].append({"message": "b"})
+        )
+
+        assert len(cookies) == 1
+
+    @pytest.mark.asyncio
+    async def test_cookie_past_half_life_is_refreshed(self):
+        secret = hashlib.sha256(b"test-key").digest()
+        backend = _SessionBackend(_make_config(secret, domain=None))
+        cookie_value = _encrypt_session(secret, {"user_id": "123"}, expires_in=3600)
+
+        cookies = await self._round_trip(backend, cookie_value)
+
+        assert len(cookies) == 1
+
+    @pytest.mark.asyncio
+    async def test_domain_configured_always_rewrites(self):
+        secret = hashlib.sha256(b"test-key").digest()
+        backend = _SessionBackend(_make_config(secret, domain=".example.com"))
+
+        cookies = await self._round_trip(backend, _encrypt_session(secret, {"user_id": "123"}))
+
+        assert any("domain=" in c.lower() for c in cookies)
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import io
+from types import SimpleNamespace
 
 import pytest
 from PIL import Image
 
-from skrift.db.services.asset_service import image_url, internal_asset_url
+from skrift.db.services.asset_service import get_asset_urls, image_url, internal_asset_url
 from skrift.middleware.storage import StorageFilesMiddleware
 from skrift.storage.base import StoredFile
 
@@ -137,6 +138,29 @@ async def test_image_url_warm_path_returns_direct_variant_url():
     assert url == "https://cdn.example.com/abc.thumb"
 
 
+async def test_get_asset_urls_resolves_each_store_once_and_keeps_order():
+    backend = FakeBackend(base_url="https://cdn.example.com")
+    manager = FakeManager(backend)
+    lookups: list[str | None] = []
+    original_get = manager.get
+
+    async def counting_get(name=None):
+        lookups.append(name)
+        return await original_get(name)
+
+    manager.get = counting_get
+    assets = [SimpleNamespace(store="default", key=k) for k in ("a", "b", "c")]
+
+    urls = await get_asset_urls(manager, assets)
+
+    assert urls == [
+        "https://cdn.example.com/a",
+        "https://cdn.example.com/b",
+        "https://cdn.example.com/c",
+    ]
+    assert lookups == ["default"]
+
+
 # -- middleware: remote backend (redirect) -----------------------------------
 
 
@@ -0,0 +1,53 @@
+import jinja2
+
+from skrift.app_factory import warm_template_cache
+
+
+def test_warm_template_cache_compiles_html_templates():
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader(
+            {
+                "page.html": "{{ title }}",
+                "post.html": "{{ body }}",
+                "feed.xml": "<feed/>",
+            }
+        )
+    )
+
+    assert warm_template_cache(env) == 2
+    assert {name for _, name in env.cache} == {"page.html", "post.html"}
+
+
+def test_warm_template_cache_skips_broken_templates():
+    env = jinja2.Environment(
+        loader=jinja2.DictLoader({"ok.html": "fine", "broken.html": "{% if %}"})
+    )
+
+    assert warm_template_cache(env) == 1
+
+
+def _configured_env(auto_reload: bool) -> jinja2.Environment:
+    from types import SimpleNamespace
+
+    from skrift.app_factory import build_template_engine_callback
+
+    env = jinja2.Environment(loader=jinja2.DictLoader({"a.html": "a"}))
+    callback = build_template_engine_callback(
+        {}, register_for_updates=False, auto_reload=auto_reload
+    )
+    callback(SimpleNamespace(engine=env))
+    return env
+
+
+def test_production_engine_disables_auto_reload_and_cache_eviction():
+    env = _configured_env(auto_reload=False)
+
+    assert env.auto_reload is False
+    assert isinstance(env.cache, dict)
+
+
+def test_debug_engine_keeps_auto_reload():
+    env = _configured_env(auto_reload=True)
+
+    assert env.auto_reload is True
+    assert not isinstance(env.cache, dict)
@@ -19,21 +19,21 @@ class MockTemplateEngine:
 
 def test_candidates_no_slugs():
     t = Template("form")
-    assert t._candidates() == ["form.html"]
+    assert t._candidates() == ("form.html",)
 
 
 def test_candidates_one_slug():
     t = Template("form", "contact")
-    assert t._candidates() == ["form-contact.html", "form.html"]
+    assert t._candidates() == ("form-contact.html", "form.html")
 
 
 def test_candidates_two_slugs():
     t = Template("page", "services", "web")
-    assert t._candidates() == [
+    assert t._candidates() == (
         "page-services-web.html",
         "page-services.html",
         "page.html",
-    ]
+    )
 
 
 # --- try_render() tests ---
@@ -130,3 +130,48 @@ def test_resolve_package_specific_wins_when_no_theme(mock_get_dirs, tmp_path):
     t = Template("page", "about")
     result = t.resolve(package_dir)
     assert result == "page-about.html"
+
+
+@patch("skrift.app_factory.get_template_directories_for_theme")
+def test_resolve_is_memoized_across_instances(mock_get_dirs, tmp_path):
+    from skrift.template import set_template_cache_enabled
+
+    set_template_cache_enabled(True)
+    mock_get_dirs.return_value = [tmp_path]
+    _create_template(tmp_path, "page.html")
+
+    assert Template("page", "about").resolve(tmp_path) == "page.html"
+
+    # A newly added, more specific template isn't seen until the cache is cleared.
+    _create_template(tmp_path, "page-about.html")
+    assert Template("page", "about").resolve(tmp_path) == "page.html"
+
+    Template.clear_cache()
+    assert Template("page", "about").resolve(tmp_path) == "page-about.html"
+
+
+@patch("skrift.app_factory.get_template_directories_for_theme")
+def test_resolve_skips_memoization_when_disabled(mock_get_dirs, tmp_path):
+    from skrift.template import set_template_cache_enabled
+
+    mock_get_dirs.return_value = [tmp_path]
+    _create_template(tmp_path, "page.html")
+    set_template_cache_enabled(False)
+    try:
+        assert Template("page", "about").resolve(tmp_path) == "page.html"
+        _create_template(tmp_path, "page-about.html")
+        assert Template("page", "about").resolve(tmp_path) == "page-about.html"
+    finally:
+        set_template_cache_enabled(True)
+
+
+@patch("skrift.app_factory.get_template_directories_for_theme")
+def test_resolve_tolerates_missing_search_dir(mock_get_dirs, tmp_path):
+    Template.clear_cache()
+    missing_dir = tmp_path / "missing"
+    package_dir = tmp_path / "package"
+    package_dir.mkdir()
+    _create_template(package_dir, "page-about.html")
+    mock_get_dirs.return_value = [missing_dir, package_dir]
+
+    assert Template("page", "about").resolve(package_dir) == "page-about.html"